@@ -2,8 +2,9 @@
 
 __all__ = ["anonymize_devices", "anonymize_device"]
 
-from dataclasses import asdict
-from uuid import uuid4
+import os
+from dataclasses import fields
+from typing import Callable
 
 from .device import HubspaceDevice, HubspaceState
 
@@ -11,6 +12,28 @@ ANONYMIZE_STATES: set[str] = {"wifi-ssid", "wifi-mac-address", "ble-mac-address"
 
 FNAME_IND: int = 0
 
+_STATE_FIELDS: tuple[str, ...] = tuple(f.name for f in fields(HubspaceState))
+
+# Random bytes are read in bulk and handed out 16 bytes at a time
+_UUID_POOL_SIZE: int = 16 * 512
+_uuid_pool: bytearray = bytearray()
+_uuid_pool_pos: int = 0
+
+
+def _anonymize_geo(state: dict) -> None:
+    state["value"] = {"geo-coordinates": {"latitude": "0", "longitude": "0"}}
+
+
+def _anonymize_value(state: dict) -> None:
+    state["value"] = _fast_uuid4()
+
+
+# functionClass -> function that anonymizes the state in-place
+_STATE_TRANSFORMS: dict[str, Callable[[dict], None]] = {
+    "geo-coordinates": _anonymize_geo,
+    **{func_class: _anonymize_value for func_class in ANONYMIZE_STATES},
+}
+
 
 def anonymize_devices(
     devices: list[HubspaceDevice], anon_name: bool = False
@@ -23,8 +46,10 @@ def anonymize_devices(
     fake_devices = []
     parents = generate_parent_mapping(devices)
     device_links = {}
-    for dev in devices:
-        fake_devices.append(anonymize_device(dev, parents, device_links, anon_name))
+    for ind, dev in enumerate(devices):
+        fake_devices.append(
+            anonymize_device(dev, parents, device_links, anon_name, name_index=ind)
+        )
     return fake_devices
 
 
@@ -36,10 +61,10 @@ def generate_parent_mapping(devices: list[HubspaceDevice]) -> dict:
     mapping = {}
     for device in devices:
         if device.children:
-            device.id = str(uuid4())
+            device.id = _fast_uuid4()
         new_children = []
         for child_id in device.children:
-            new_uuid = str(uuid4())
+            new_uuid = _fast_uuid4()
             mapping[child_id] = {"parent": device.id, "new": new_uuid}
             new_children.append(new_uuid)
         device.children = new_children
@@ -51,32 +76,72 @@ def anonymize_device(
     parent_mapping: dict,
     device_links: dict,
     anon_name: bool,
+    name_index: int | None = None,
 ) -> dict:
-    fake_dev = asdict(dev)
-    if anon_name:
+    """Remove identifying information from a single device
+
+    :param dev: Device to anonymize
+    :param parent_mapping: Anonymized links between parents and children
+    :param device_links: Anonymized device_id mapping shared across devices
+    :param anon_name: If true, give the device a unique name
+    :param name_index: Index used when generating the unique name. Defaults
+        to the next value of a module-wide counter
+    """
+    if anon_name and name_index is None:
         global FNAME_IND
-        fake_dev["friendly_name"] = f"friendly-device-{FNAME_IND}"
+        name_index = FNAME_IND
         FNAME_IND += 1
     if dev.id in parent_mapping:
-        fake_dev["id"] = parent_mapping[dev.id]["new"]
+        fake_id = parent_mapping[dev.id]["new"]
     else:
-        fake_dev["id"] = str(uuid4())
+        fake_id = _fast_uuid4()
     dev_link = dev.device_id
     if dev_link not in device_links:
-        device_links[dev_link] = str(uuid4())
-    fake_dev["device_id"] = device_links[dev_link]
-    fake_dev["states"] = []
-    for state in dev.states:
-        fake_dev["states"].append(anonymize_state(state))
-    return fake_dev
+        device_links[dev_link] = _fast_uuid4()
+    return {
+        "id": fake_id,
+        "device_id": device_links[dev_link],
+        "model": dev.model,
+        "device_class": dev.device_class,
+        "default_name": dev.default_name,
+        "default_image": dev.default_image,
+        "friendly_name": (
+            f"friendly-device-{name_index}" if anon_name else dev.friendly_name
+        ),
+        "functions": dev.functions,
+        "states": [anonymize_state(state) for state in dev.states],
+        "children": dev.children,
+        "manufacturerName": dev.manufacturerName,
+    }
 
 
 def anonymize_state(state: HubspaceState, only_geo: bool = False) -> dict:
-    fake_state = asdict(state)
+    fake_state = _shallow_state_asdict(state)
     fake_state["lastUpdateTime"] = 0
-    if fake_state["functionClass"] == "geo-coordinates":
-        fake_state["value"] = {"geo-coordinates": {"latitude": "0", "longitude": "0"}}
-    elif not only_geo:
-        if fake_state["functionClass"] in ANONYMIZE_STATES:
-            fake_state["value"] = str(uuid4())
+    transform = _STATE_TRANSFORMS.get(fake_state["functionClass"])
+    if transform and (not only_geo or transform is _anonymize_geo):
+        transform(fake_state)
     return fake_state
+
+
+def _shallow_state_asdict(state: HubspaceState) -> dict:
+    """Convert the state to a dict without deep-copying its fields"""
+    return {name: getattr(state, name) for name in _STATE_FIELDS}
+
+
+def _fast_uuid4() -> str:
+    """Generate a random (version 4) UUID string from a pre-filled pool"""
+    global _uuid_pool, _uuid_pool_pos
+    if _uuid_pool_pos >= len(_uuid_pool):
+        _uuid_pool = bytearray(os.urandom(_UUID_POOL_SIZE))
+        _uuid_pool_pos = 0
+    start = _uuid_pool_pos
+    _uuid_pool_pos += 16
+    uuid_bytes = _uuid_pool[start:_uuid_pool_pos]
+    uuid_bytes[6] = (uuid_bytes[6] & 0x0F) | 0x40
+    uuid_bytes[8] = (uuid_bytes[8] & 0x3F) | 0x80
+    hex_val = uuid_bytes.hex()
+    return (
+        f"{hex_val[:8]}-{hex_val[8:12]}-{hex_val[12:16]}-"
+        f"{hex_val[16:20]}-{hex_val[20:]}"
+    )
@@ -4,13 +4,38 @@ __all__ = [
     "get_hs_device",
 ]
 import logging
+import sys
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
+# (device_class, default_image, model) -> corrected model. A model of ""
+# matches a device without a model and None matches any model.
+_MODEL_FIXUPS: dict[tuple[str, str, str | None], str] = {
+    # Exhaust fans
+    ("exhaust-fan", "fan-exhaust-icon", None): "BF1112",
+    # Fans
+    **{
+        (fan_class, default_image, model): new_model
+        for fan_class in ("fan", "ceiling-fan")
+        for default_image, model, new_model in (
+            ("ceiling-fan-snyder-park-icon", "", "Driskol"),
+            ("ceiling-fan-vinings-icon", "", "Vinwood"),
+            ("ceiling-fan-chandra-icon", "TBD", "Zandra"),
+            ("ceiling-fan-ac-cct-dardanus-icon", "TBD", "Nevali"),
+            ("ceiling-fan-slender-icon", "", "Tager"),
+        )
+    },
+    # Lights
+    ("light", "a19-e26-color-cct-60w-smd-frosted-icon", None): "12A19060WRGBWH2",
+    ("light", "slide-dimmer-icon", None): "HPDA110NWBP",
+    # Switches
+    ("switch", "smart-switch-icon", "TBD"): "HPSA11CWB",
+}
+
 
-@dataclass
+@dataclass(slots=True)
 class HubspaceState:
     """State of a given function
 
@@ -27,7 +52,7 @@ class HubspaceState:
     functionInstance: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class HubspaceDevice:
     id: str
     device_id: str
@@ -47,44 +72,17 @@ class HubspaceDevice:
     def __post_init__(self):
         # Dimmer Switch fix - A switch cannot dim, but a light can
         if self.device_class == "switch" and any(
-            [state.functionClass == "brightness" for state in self.states]
+            state.functionClass == "brightness" for state in self.states
         ):
             self.device_class = "light"
-        # Fix exhaust fans
-        if (
-            self.device_class == "exhaust-fan"
-            and self.default_image == "fan-exhaust-icon"
-        ):
-            self.model = "BF1112"
-        # Fix fans
-        if self.device_class in ["fan", "ceiling-fan"]:
-            if not self.model and self.default_image == "ceiling-fan-snyder-park-icon":
-                self.model = "Driskol"
-            elif not self.model and self.default_image == "ceiling-fan-vinings-icon":
-                self.model = "Vinwood"
-            elif (
-                self.model == "TBD" and self.default_image == "ceiling-fan-chandra-icon"
-            ):
-                self.model = "Zandra"
-            elif (
-                self.model == "TBD"
-                and self.default_image == "ceiling-fan-ac-cct-dardanus-icon"
-            ):
-                self.model = "Nevali"
-            elif not self.model and self.default_image == "ceiling-fan-slender-icon":
-                self.model = "Tager"
-        # Fix lights
-        elif self.device_class == "light":
-            if self.default_image == "a19-e26-color-cct-60w-smd-frosted-icon":
-                self.model = "12A19060WRGBWH2"
-            elif self.default_image == "slide-dimmer-icon":
-                self.model = "HPDA110NWBP"
-        # Fix switches
-        elif self.device_class == "switch":
-            if self.default_image == "smart-switch-icon" and self.model == "TBD":
-                self.model = "HPSA11CWB"
+        # Fix known models, preferring an exact model match over any model
+        new_model = _MODEL_FIXUPS.get(
+            (self.device_class, self.default_image, self.model or "")
+        ) or _MODEL_FIXUPS.get((self.device_class, self.default_image, None))
+        if new_model:
+            self.model = new_model
         # Fix glass doors - Treat as a switch
-        elif self.device_class == "glass-door":
+        if self.device_class == "glass-door":
             self.device_class = "switch"
             self.manufacturerName = "Feather River Doors"
         # Attempt to fix anything TBD
@@ -92,34 +90,44 @@ class HubspaceDevice:
             self.model = self.default_name
 
 
-def get_hs_device(hs_device: dict[str, Any]) -> HubspaceDevice:
-    """Convert the Hubspace device definition into a HubspaceDevice"""
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern strings drawn from a small vocabulary so comparisons are cheap"""
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def get_hs_device(
+    hs_device: dict[str, Any], function_classes: Optional[frozenset[str]] = None
+) -> HubspaceDevice:
+    """Convert the Hubspace device definition into a HubspaceDevice
+
+    :param hs_device: Raw device from Hubspace
+    :param function_classes: Only build states for these functionClasses. Default: all
+    """
     description = hs_device.get("description", {})
     device = description.get("device", {})
-    processed_states: list[HubspaceState] = []
-    for state in hs_device.get("state", {}).get("values", []):
-        processed_states.append(
-            HubspaceState(
-                functionClass=state.get("functionClass"),
-                value=state.get("value"),
-                lastUpdateTime=state.get("lastUpdateTime"),
-                functionInstance=state.get("functionInstance"),
-            )
+    processed_states: list[HubspaceState] = [
+        HubspaceState(
+            functionClass=_intern(state.get("functionClass")),
+            value=state.get("value"),
+            lastUpdateTime=state.get("lastUpdateTime"),
+            functionInstance=_intern(state.get("functionInstance")),
         )
-    dev_dict = {
-        "id": hs_device.get("id"),
-        "device_id": hs_device.get("deviceId"),
-        "model": device.get("model"),
-        "device_class": device.get("deviceClass"),
-        "default_name": device.get("defaultName"),
-        "default_image": description.get("defaultImage"),
-        "friendly_name": hs_device.get("friendlyName"),
-        "functions": description.get("functions", []),
-        "states": processed_states,
-        "children": hs_device.get("children", []),
-        "manufacturerName": device.get("manufacturerName"),
-    }
-    return HubspaceDevice(**dev_dict)
+        for state in hs_device.get("state", {}).get("values", ())
+        if function_classes is None or state.get("functionClass") in function_classes
+    ]
+    return HubspaceDevice(
+        id=hs_device.get("id"),
+        device_id=hs_device.get("deviceId"),
+        model=_intern(device.get("model")),
+        device_class=_intern(device.get("deviceClass")),
+        default_name=device.get("defaultName"),
+        default_image=_intern(description.get("defaultImage")),
+        friendly_name=hs_device.get("friendlyName"),
+        functions=description.get("functions", []),
+        states=processed_states,
+        children=hs_device.get("children", []),
+        manufacturerName=device.get("manufacturerName"),
+    )
 
 
 def get_function_from_device(
@@ -131,6 +139,7 @@ def get_function_from_device(
     :param function_class: Function class to find
     :param function_instance: Function instance to find. Default: None
     """
+    function_class = _intern(function_class)
     for func in functions:
         if func.get("functionClass") != function_class:
             continue
@@ -138,3 +147,19 @@ def get_function_from_device(
             continue
         return func
     return None
+
+
+def index_functions(functions: list[dict]) -> dict[tuple[str, str | None], dict]:
+    """Map (functionClass, functionInstance) to its function for repeated lookups
+
+    The first matching function wins, the same as get_function_from_device.
+
+    :param functions: List of functions to index
+    """
+    index: dict[tuple[str, str | None], dict] = {}
+    for func in functions:
+        index.setdefault(
+            (_intern(func.get("functionClass")), _intern(func.get("functionInstance"))),
+            func,
+        )
+    return index
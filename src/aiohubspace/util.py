@@ -1,3 +1,5 @@
+import math
+from bisect import bisect_left
 from typing import Any
 
 
@@ -17,14 +19,17 @@ def percentage_to_ordered_list_item[_T](ordered_list: list[_T], percentage: int)
     """
     if not (list_len := len(ordered_list)):
         raise ValueError("The ordered list is empty")
+    return ordered_list[_percentage_to_index(list_len, percentage)]
 
-    for offset, speed in enumerate(ordered_list):
-        list_position = offset + 1
-        upper_bound = (list_position * 100) // list_len
-        if percentage <= upper_bound:
-            return speed
 
-    return ordered_list[-1]
+def _percentage_to_index(list_len: int, percentage: int) -> int:
+    """Find the index of the first item whose upper bound covers the percentage
+
+    Closed-form equivalent of walking the list until
+    ``percentage <= (position * 100) // list_len``.
+    """
+    index = (math.ceil(percentage) * list_len + 99) // 100 - 1
+    return min(max(index, 0), list_len - 1)
 
 
 def ordered_list_item_to_percentage[_T](ordered_list: list[_T], item: _T) -> int:
@@ -50,20 +55,33 @@ def ordered_list_item_to_percentage[_T](ordered_list: list[_T], item: _T) -> int
     return (list_position * 100) // list_len
 
 
+def closest_value(sorted_values: list[int], value: int) -> int:
+    """Find the item closest to the value, preferring the lower item on a tie
+
+    :param sorted_values: Values sorted in ascending order
+    :param value: Value to match
+    """
+    if not sorted_values:
+        raise ValueError("The sorted list is empty")
+    index = bisect_left(sorted_values, value)
+    if index == len(sorted_values) or (
+        index and value - sorted_values[index - 1] <= sorted_values[index] - value
+    ):
+        index -= 1
+    return sorted_values[index]
+
+
 def process_range(range_vals: dict) -> list[Any]:
     """Process a range to determine what's supported
 
     :param range_vals: Result from functions["values"][x]
     """
-    supported_range = []
     range_min = range_vals["range"]["min"]
     range_max = range_vals["range"]["max"]
     range_step = range_vals["range"]["step"]
     if range_min == range_max:
-        supported_range.append(range_max)
-    else:
-        for val in range(range_min, range_max, range_step):
-            supported_range.append(val)
-    if range_max not in supported_range:
-        supported_range.append(range_max)
+        return [range_max]
+    # range() never includes the upper bound, so it is always appended
+    supported_range = list(range(range_min, range_max, range_step))
+    supported_range.append(range_max)
     return supported_range
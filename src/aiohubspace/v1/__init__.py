@@ -14,13 +14,13 @@ __all__ = [
 
 import asyncio
 import contextlib
-import copy
 import logging
 from contextlib import asynccontextmanager
 from types import TracebackType
-from typing import Any, Callable, Generator, Optional
+from typing import Any, Callable, Generator, KeysView, Optional
 
 import aiohttp
+import orjson
 from aiohttp import web_exceptions
 
 from ..errors import DeviceNotFound, ExceededMaximumRetries, InvalidAuth
@@ -54,7 +54,9 @@ class HubspaceBridgeV1:
         self._account_id: Optional[str] = None
         self._auth = HubspaceAuth(username, password, refresh_token=refresh_token)
         self.logger = logging.getLogger(f"{__package__}[{username}]")
-        self.logger.addHandler(logging.StreamHandler())
+        # Loggers are shared per username so only attach the handler once
+        if not self.logger.handlers:
+            self.logger.addHandler(logging.StreamHandler())
         self._known_devs: dict[str, BaseResourcesController] = {}
         # Data Updater
         self._events: EventStream = EventStream(self, polling_interval)
@@ -133,10 +135,22 @@ class HubspaceBridgeV1:
                 initialized.append(controller)
         return initialized
 
+    @property
+    def function_classes(self) -> frozenset[str]:
+        """All functionClasses whose states are read by a controller"""
+        return frozenset().union(
+            *(controller.ITEM_STATES for controller in self._controllers)
+        )
+
     @property
     def tracked_devices(self) -> set:
         return set(self._known_devs.keys())
 
+    @property
+    def tracked_ids(self) -> KeysView[str]:
+        """Live view of the tracked device IDs without copying them"""
+        return self._known_devs.keys()
+
     def add_device(
         self, device_id: str, controller: BaseResourcesController[HubspaceResource]
     ) -> None:
@@ -229,7 +243,7 @@ class HubspaceBridgeV1:
             params=params,
         )
         res.raise_for_status()
-        data = await res.json()
+        data = await res.json(loads=orjson.loads)
         if not isinstance(data, list):
             raise ValueError(data)
         return data
@@ -255,13 +269,12 @@ class HubspaceBridgeV1:
             self.events.emit(EventType.INVALID_AUTH)
             raise
         else:
-            headers = get_headers(
+            kwargs["headers"] = get_headers(
                 **{
                     "authorization": f"Bearer {token}",
+                    **kwargs.get("headers", {}),
                 }
             )
-            headers.update(kwargs.get("headers", {}))
-            kwargs["headers"] = headers
             kwargs["ssl"] = True
             async with self._web_session.request(method, url, **kwargs) as res:
                 yield res
@@ -300,6 +313,4 @@ class HubspaceBridgeV1:
 
 
 def get_headers(**kwargs):
-    headers = copy.copy(v1_const.DEFAULT_HEADERS)
-    headers.update(kwargs)
-    return headers
+    return {**v1_const.DEFAULT_HEADERS, **kwargs}
@@ -4,7 +4,7 @@ import time
 from asyncio.coroutines import iscoroutinefunction
 from dataclasses import dataclass, fields
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Callable, Generic, Iterator, TypeVar
+from typing import TYPE_CHECKING, Any, Callable, Generic, Iterator, TypeVar
 
 from ...device import HubspaceDevice, HubspaceState, get_hs_device
 from ...errors import DeviceNotFound, ExceededMaximumRetries
@@ -30,10 +30,16 @@ class BaseResourcesController(Generic[HubspaceResource]):
     """Base Controller for Hubspace devices"""
 
     ITEM_TYPE_ID: ResourceTypes | None = None
-    ITEM_TYPES: list[ResourceTypes] | None = None
+    ITEM_TYPES: frozenset[ResourceTypes] | None = None
     ITEM_CLS = None
     # functionClass map between controller -> Hubspace
     ITEM_MAPPING: dict = {}
+    # functionClasses read from HubspaceDevice.states
+    ITEM_STATES: frozenset[str] = frozenset()
+    # Seconds to wait for additional updates before sending a batched update
+    UPDATE_BATCH_DELAY: float = 0.02
+    # Maximum number of requests to update Hubspace that can run at once
+    MAX_CONCURRENT_UPDATES: int = 8
 
     def __init__(self, bridge: "HubspaceBridgeV1") -> None:
         """Initialize instance."""
@@ -42,7 +48,10 @@ class BaseResourcesController(Generic[HubspaceResource]):
         self._logger = bridge.logger.getChild(self.ITEM_CLS.__name__)
         self._subscribers: dict[str, EventSubscriptionType] = {ID_FILTER_ALL: []}
         self._initialized: bool = False
-        self._item_values = [x.value for x in self.ITEM_TYPES]
+        self._item_values = frozenset(x.value for x in self.ITEM_TYPES)
+        self._pending_updates: dict[str, tuple[dataclass, asyncio.Future]] = {}
+        self._last_states: dict[str, list[tuple[str, str | None, Any]]] = {}
+        self._update_sem = asyncio.Semaphore(self.MAX_CONCURRENT_UPDATES)
 
     def __getitem__(self, device_id: str) -> HubspaceResource:
         """Get item by device_id."""
@@ -96,6 +105,7 @@ class BaseResourcesController(Generic[HubspaceResource]):
             self._bridge.add_device(evt_data["device"].id, self)
         elif evt_type == EventType.RESOURCE_DELETED:
             cur_item = self._items.pop(item_id, evt_data)
+            self._last_states.pop(item_id, None)
             self._bridge.remove_device(evt_data["device_id"])
         elif evt_type == EventType.RESOURCE_UPDATED:
             # existing item updated
@@ -189,6 +199,20 @@ class BaseResourcesController(Generic[HubspaceResource]):
             )
         self._initialized = True
 
+    def states_changed(self, hs_device: HubspaceDevice) -> bool:
+        """Determine if the states differ from the last ones seen for the device
+
+        :param hs_device: Device containing the latest states
+        """
+        current = [
+            (state.functionClass, state.functionInstance, state.value)
+            for state in hs_device.states
+        ]
+        if self._last_states.get(hs_device.id) == current:
+            return False
+        self._last_states[hs_device.id] = current
+        return True
+
     async def initialize_elem(
         self, element: HubspaceDevice
     ) -> None:  # pragma: no cover
@@ -289,7 +313,10 @@ class BaseResourcesController(Generic[HubspaceResource]):
         }
         payload = {"metadeviceId": str(device_id), "values": states}
         try:
-            res = await self._bridge.request("put", url, json=payload, headers=headers)
+            async with self._update_sem:
+                res = await self._bridge.request(
+                    "put", url, json=payload, headers=headers
+                )
         except ExceededMaximumRetries:
             self._logger.warning("Maximum retries exceeded for %s", device_id)
             return False
@@ -323,6 +350,9 @@ class BaseResourcesController(Generic[HubspaceResource]):
             return
         # Make a clone to restore if the update fails
         fallback = copy.deepcopy(cur_item)
+        # The item no longer reflects the last seen states
+        self._last_states.pop(device_id, None)
+        self._bridge.events.reset_last_update(device_id)
         if obj_in:
             hs_states = dataclass_to_hs(cur_item, obj_in, self.ITEM_MAPPING)
             if not hs_states:
@@ -337,6 +367,45 @@ class BaseResourcesController(Generic[HubspaceResource]):
         if not await self.update_hubspace_api(device_id, hs_states):
             self._items[device_id] = fallback
 
+    async def update_batched(self, device_id: str, obj_in: dataclass) -> None:
+        """Update Hubspace, merging concurrent updates into a single request
+
+        Updates for the same device requested within UPDATE_BATCH_DELAY of
+        the first are merged, with later values taking precedence. Every
+        caller returns once the merged update has been sent. If the update
+        fails, the error is raised to every caller. If the first caller is
+        cancelled before the update completes, the merged callers are
+        cancelled as well.
+
+        :param device_id: Hubspace Device ID
+        :param obj_in: Hubspace Resource elements to change
+        """
+        if device_id in self._pending_updates:
+            pending_obj, pending_update = self._pending_updates[device_id]
+            update_dataclass(pending_obj, obj_in)
+            await asyncio.shield(pending_update)
+            return
+        pending_update = asyncio.get_running_loop().create_future()
+        self._pending_updates[device_id] = (obj_in, pending_update)
+        try:
+            await asyncio.sleep(self.UPDATE_BATCH_DELAY)
+            # Anything requested from this point waits for the next update
+            del self._pending_updates[device_id]
+            await self.update(device_id, obj_in=obj_in)
+        except asyncio.CancelledError:
+            pending_update.cancel()
+            raise
+        except Exception as err:
+            pending_update.set_exception(err)
+            # Raised below, so the future's copy does not need retrieving
+            pending_update.exception()
+            raise
+        else:
+            pending_update.set_result(None)
+        finally:
+            if self._pending_updates.get(device_id, (None, None))[1] is pending_update:
+                del self._pending_updates[device_id]
+
     def get_device(self, device_id) -> HubspaceResource:
         try:
             return self[device_id]
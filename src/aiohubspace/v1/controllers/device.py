@@ -22,8 +22,17 @@ class DeviceController(BaseResourcesController[Device]):
     """Controller that identifies top-level components."""
 
     ITEM_TYPE_ID = ResourceTypes.DEVICE
-    ITEM_TYPES = []
+    ITEM_TYPES = frozenset()
     ITEM_CLS = Device
+    ITEM_STATES = frozenset(
+        [
+            "available",
+            "ble-mac-address",
+            "wifi-mac-address",
+            *sensor.MAPPED_SENSORS,
+            *sensor.BINARY_SENSORS,
+        ]
+    )
 
     async def initialize_elem(self, hs_device: HubspaceDevice) -> Device:
         """Initialize the element"""
@@ -71,16 +80,8 @@ class DeviceController(BaseResourcesController[Device]):
             available=available,
             sensors=sensors,
             binary_sensors=binary_sensors,
-            device_information=DeviceInformation(
-                device_class=hs_device.device_class,
-                default_image=hs_device.default_image,
-                default_name=hs_device.default_name,
-                manufacturer=hs_device.manufacturerName,
-                model=hs_device.model,
-                name=hs_device.friendly_name,
-                parent_id=hs_device.device_id,
-                wifi_mac=wifi_mac,
-                ble_mac=ble_mac,
+            device_information=DeviceInformation.from_hs_device(
+                hs_device, wifi_mac=wifi_mac, ble_mac=ble_mac
             ),
         )
         return self._items[hs_device.id]
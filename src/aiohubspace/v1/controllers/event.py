@@ -1,6 +1,8 @@
 """Handle connecting to Hubspace and distribute events."""
 
 import asyncio
+import heapq
+import itertools
 from asyncio.coroutines import iscoroutinefunction
 from collections.abc import Callable
 from enum import Enum
@@ -10,7 +12,7 @@ from typing import TYPE_CHECKING, Any, NotRequired, TypedDict
 from aiohttp.client_exceptions import ClientError
 from aiohttp.web_exceptions import HTTPForbidden, HTTPTooManyRequests
 
-from ...device import HubspaceDevice, get_hs_device
+from ...device import HubspaceDevice, HubspaceState, get_hs_device
 from ...errors import InvalidAuth
 from ...types import EventType
 
@@ -42,12 +44,27 @@ class HubspaceEvent(TypedDict):
 
 
 EventCallBackType = Callable[[EventType, dict | None], None]
+# Sequence number first so subscriptions sort into subscription order
 EventSubscriptionType = tuple[
+    int,
     EventCallBackType,
-    "tuple[EventType] | None",
-    "tuple[ResourceTypes] | None",
+    "frozenset[str] | None",
+    bool,
 ]
 
+EVENT_FILTER_ALL = "*"
+
+
+def latest_update_time(states: list[HubspaceState]) -> int | None:
+    """Determine the most recent update time (in epoch ms) across the states
+
+    Returns None when no state reports an update time
+    """
+    return max(
+        [state.lastUpdateTime for state in states if state.lastUpdateTime],
+        default=None,
+    )
+
 
 class EventStream:
 
@@ -58,9 +75,15 @@ class EventStream:
         self._event_queue = asyncio.Queue()
         self._status = EventStreamStatus.DISCONNECTED
         self._bg_tasks: list[asyncio.Task] = []
-        self._subscribers: list[EventSubscriptionType] = []
+        # EventType -> subscriptions. Unfiltered subscriptions use EVENT_FILTER_ALL
+        self._subscribers: dict[EventType | str, list[EventSubscriptionType]] = {
+            EVENT_FILTER_ALL: []
+        }
+        self._subscription_seq = itertools.count()
         self._logger = bridge.logger.getChild("events")
         self._polling_interval: int = polling_interval
+        # Most recent lastUpdateTime seen for each device
+        self._last_update: dict[str, int | None] = {}
 
     @property
     def connected(self) -> bool:
@@ -116,42 +139,66 @@ class EventStream:
         Returns:
             function to unsubscribe.
         """
-        if not isinstance(event_filter, NoneType | tuple):
+        if event_filter is None:
+            event_filter = (EVENT_FILTER_ALL,)
+        elif not isinstance(event_filter, tuple):
             event_filter = (event_filter,)
+        # Register once per event type so the callback is only called once
+        event_filter = tuple(dict.fromkeys(event_filter))
         if not isinstance(resource_filter, NoneType | tuple):
             resource_filter = (resource_filter,)
-        subscription = (callback, event_filter, resource_filter)
+        if resource_filter is not None:
+            resource_filter = frozenset(resource_filter)
+        subscription = (
+            next(self._subscription_seq),
+            callback,
+            resource_filter,
+            iscoroutinefunction(callback),
+        )
+
+        for event_key in event_filter:
+            if event_key not in self._subscribers:
+                self._subscribers[event_key] = []
+            self._subscribers[event_key].append(subscription)
 
         def unsubscribe():
-            self._subscribers.remove(subscription)
+            for event_key in event_filter:
+                if event_key not in self._subscribers:
+                    continue
+                self._subscribers[event_key].remove(subscription)
 
-        self._subscribers.append(subscription)
         return unsubscribe
 
+    def reset_last_update(self, device_id: str) -> None:
+        """Force the next poll to emit an update for the device
+
+        :param device_id: ID of the device that was changed locally
+        """
+        self._last_update.pop(device_id, None)
+
     def add_job(self, event: HubspaceEvent) -> None:
         """Manually add a job to be processed."""
         self._event_queue.put_nowait(event)
 
     def emit(self, event_type: EventType, data: HubspaceEvent = None) -> None:
         """Emit event to all listeners."""
-        for callback, event_filter, resource_filter in self._subscribers:
+        # Both buckets are already in subscription order, so merge without copying
+        subscribers = heapq.merge(
+            self._subscribers.get(event_type, ()), self._subscribers[EVENT_FILTER_ALL]
+        )
+        for _, callback, resource_filter, is_coroutine in subscribers:
             try:
-                if event_filter is not None and event_type not in event_filter:
-                    continue
                 if (
                     resource_filter is not None
                     and data is not None
                     and (
                         "device" in data
                         and data["device"]
-                        and not any(
-                            data["device"].device_class == res_filter
-                            for res_filter in resource_filter
-                        )
+                        and data["device"].device_class not in resource_filter
                     )
                 ):
                     continue
-                if iscoroutinefunction(callback):
+                if is_coroutine:
                     asyncio.create_task(callback(event_type, data))
                 else:
                     callback(event_type, data)
@@ -216,15 +263,31 @@ class EventStream:
 
         :param data: Raw data from Hubspace
         """
-        processed_ids = []
-        skipped_ids = []
+        seen_ids: set[str] = set()
+        tracked_devs = self._bridge.tracked_ids
+        function_classes = self._bridge.function_classes
         for dev in data:
-            hs_dev = get_hs_device(dev)
+            if dev.get("id") in tracked_devs:
+                event_type = EventType.RESOURCE_UPDATED
+                # Updates only need the states a controller reads
+                hs_dev = get_hs_device(dev, function_classes=function_classes)
+            else:
+                event_type = EventType.RESOURCE_ADDED
+                # New devices are initialized from, and emitted with, every state
+                hs_dev = get_hs_device(dev)
             if not hs_dev.device_class:
                 continue
-            event_type = EventType.RESOURCE_UPDATED
-            if hs_dev.id not in self._bridge.tracked_devices:
-                event_type = EventType.RESOURCE_ADDED
+            seen_ids.add(hs_dev.id)
+            latest_update = latest_update_time(hs_dev.states)
+            if (
+                event_type == EventType.RESOURCE_UPDATED
+                # Without timestamps there is no way to tell if anything changed
+                and latest_update is not None
+                and self._last_update.get(hs_dev.id) == latest_update
+            ):
+                # Nothing has changed since the last poll
+                continue
+            self._last_update[hs_dev.id] = latest_update
             self._event_queue.put_nowait(
                 HubspaceEvent(
                     type=event_type,
@@ -233,14 +296,13 @@ class EventStream:
                     force_forward=False,
                 )
             )
-            processed_ids.append(hs_dev.id)
         # Handle devices that did not report in from the API
-        for dev_id in self._bridge.tracked_devices:
-            if dev_id not in processed_ids + skipped_ids:
-                self._event_queue.put_nowait(
-                    HubspaceEvent(type=EventType.RESOURCE_DELETED, device_id=dev_id)
-                )
-                self._bridge.remove_device(dev_id)
+        for dev_id in tracked_devs - seen_ids:
+            self._event_queue.put_nowait(
+                HubspaceEvent(type=EventType.RESOURCE_DELETED, device_id=dev_id)
+            )
+            self._bridge.remove_device(dev_id)
+            self._last_update.pop(dev_id, None)
 
     async def perform_poll(self) -> None:
         """Poll Hubspace and generate the required events"""
@@ -263,11 +325,15 @@ class EventStream:
             await asyncio.sleep(self._polling_interval)
 
     async def process_event(self):
-        try:
-            event: HubspaceEvent = await self._event_queue.get()
-            self.emit(event["type"], event)
-        except Exception:
-            self._logger.exception("Unhandled exception. Please open a bug report")
+        """Emit all queued events, waiting only if the queue is empty"""
+        events: list[HubspaceEvent] = [await self._event_queue.get()]
+        while not self._event_queue.empty():
+            events.append(self._event_queue.get_nowait())
+        for event in events:
+            try:
+                self.emit(event["type"], event)
+            except Exception:
+                self._logger.exception("Unhandled exception. Please open a bug report")
 
     async def __event_processor(self) -> None:
         """Process the hubspace devices"""
@@ -1,27 +1,137 @@
 """Controller holding and managing Hubspace resources of type `fan`."""
 
+from typing import Any, Callable
+
 from ... import device
-from ...device import HubspaceDevice
+from ...device import HubspaceDevice, HubspaceState
 from ...util import ordered_list_item_to_percentage
 from ..models import features
 from ..models.fan import Fan, FanPut
 from ..models.resource import DeviceInformation, ResourceTypes
 from .base import BaseResourcesController
 
-KNOWN_PRESETS = {"comfort-breeze"}
+KNOWN_PRESETS: frozenset[str] = frozenset({"comfort-breeze"})
+
+
+def _init_power(hs_device: HubspaceDevice, state: HubspaceState, attrs: dict) -> None:
+    attrs["on"] = features.OnFeature(on=state.value == "on")
+
+
+def _init_speed(hs_device: HubspaceDevice, state: HubspaceState, attrs: dict) -> None:
+    speeds = device.get_function_from_device(
+        hs_device.functions, state.functionClass, state.functionInstance
+    )
+    speeds = sorted(
+        {
+            value["name"]
+            for value in speeds["values"]
+            if not value["name"].endswith("-000")
+        }
+    )
+    percentage = ordered_list_item_to_percentage(speeds, state.value)
+    attrs["speed"] = features.SpeedFeature(speed=percentage, speeds=speeds)
+
+
+def _init_direction(
+    hs_device: HubspaceDevice, state: HubspaceState, attrs: dict
+) -> None:
+    attrs["direction"] = features.DirectionFeature(forward=state.value == "forward")
+
+
+def _init_preset(hs_device: HubspaceDevice, state: HubspaceState, attrs: dict) -> None:
+    if state.functionInstance not in KNOWN_PRESETS:
+        return
+    # I have only seen fans with a single preset
+    attrs["preset"] = features.PresetFeature(
+        enabled=state.value == "enabled",
+        func_class=state.functionClass,
+        func_instance=state.functionInstance,
+    )
+
+
+def _init_available(
+    hs_device: HubspaceDevice, state: HubspaceState, attrs: dict
+) -> None:
+    attrs["available"] = state.value
+
+
+def _update_power(
+    cur_item: Fan, value: Any, instance: str | None, updated_keys: set
+) -> None:
+    new_val = value == "on"
+    if cur_item.on.on != new_val:
+        cur_item.on.on = new_val
+        updated_keys.add("on")
+
+
+def _update_speed(
+    cur_item: Fan, value: Any, instance: str | None, updated_keys: set
+) -> None:
+    new_val = cur_item.speed.percentages[value]
+    if cur_item.speed.speed != new_val:
+        cur_item.speed.speed = new_val
+        updated_keys.add("speed")
+
+
+def _update_direction(
+    cur_item: Fan, value: Any, instance: str | None, updated_keys: set
+) -> None:
+    new_val = value == "forward"
+    if cur_item.direction.forward != new_val:
+        cur_item.direction.forward = new_val
+        updated_keys.add("direction")
+
+
+def _update_preset(
+    cur_item: Fan, value: Any, instance: str | None, updated_keys: set
+) -> None:
+    if instance not in KNOWN_PRESETS:
+        return
+    new_val = value == "enabled"
+    if cur_item.preset.enabled != new_val:
+        cur_item.preset.enabled = new_val
+        updated_keys.add("preset")
+
+
+def _update_available(
+    cur_item: Fan, value: Any, instance: str | None, updated_keys: set
+) -> None:
+    if cur_item.available != value:
+        cur_item.available = value
+        updated_keys.add("available")
+
+
+# functionClass -> handler that populates the Fan attributes from the state
+_FAN_INIT_HANDLERS: dict[str, Callable[[HubspaceDevice, HubspaceState, dict], None]] = {
+    "power": _init_power,
+    "fan-speed": _init_speed,
+    "fan-reverse": _init_direction,
+    "toggle": _init_preset,
+    "available": _init_available,
+}
+
+# functionClass -> handler that applies the state value and tracks the updated keys
+_FAN_UPDATE_HANDLERS: dict[str, Callable[[Fan, Any, str | None, set], None]] = {
+    "power": _update_power,
+    "fan-speed": _update_speed,
+    "fan-reverse": _update_direction,
+    "toggle": _update_preset,
+    "available": _update_available,
+}
 
 
 class FanController(BaseResourcesController[Fan]):
     """Controller holding and managing Hubspace resources of type `fan`."""
 
     ITEM_TYPE_ID = ResourceTypes.DEVICE
-    ITEM_TYPES = [ResourceTypes.FAN]
+    ITEM_TYPES = frozenset([ResourceTypes.FAN])
     ITEM_CLS = Fan
     ITEM_MAPPING = {
         "on": "power",
         "speed": "fan-speed",
         "direction": "fan-reverse",
     }
+    ITEM_STATES = frozenset(_FAN_INIT_HANDLERS) | frozenset(_FAN_UPDATE_HANDLERS)
 
     async def turn_on(self, device_id: str) -> None:
         """Turn on the fan."""
@@ -50,93 +160,35 @@ class FanController(BaseResourcesController[Fan]):
 
     async def initialize_elem(self, hs_device: HubspaceDevice) -> Fan:
         """Initialize the element"""
-        available: bool = False
-        on: features.OnFeature | None = None
-        speed: features.SpeedFeature | None = None
-        direction: features.DirectionFeature | None = None
-        preset: features.PresetFeature | None = None
+        attrs: dict[str, Any] = {
+            "available": False,
+            "on": None,
+            "speed": None,
+            "direction": None,
+            "preset": None,
+        }
         for state in hs_device.states:
-            if state.functionClass == "power":
-                on = features.OnFeature(on=state.value == "on")
-            elif state.functionClass == "fan-speed":
-                speeds = device.get_function_from_device(
-                    hs_device.functions, state.functionClass, state.functionInstance
-                )
-                tmp_speed = set()
-                for value in speeds["values"]:
-                    if not value["name"].endswith("-000"):
-                        tmp_speed.add(value["name"])
-                speeds = list(sorted(tmp_speed))
-                percentage = ordered_list_item_to_percentage(speeds, state.value)
-                speed = features.SpeedFeature(speed=percentage, speeds=speeds)
-            elif state.functionClass == "fan-reverse":
-                direction = features.DirectionFeature(forward=state.value == "forward")
-            elif (
-                state.functionClass == "toggle"
-                and state.functionInstance in KNOWN_PRESETS
-            ):
-                # I have only seen fans with a single preset
-                preset = features.PresetFeature(
-                    enabled=state.value == "enabled",
-                    func_class=state.functionClass,
-                    func_instance=state.functionInstance,
-                )
-            elif state.functionClass == "available":
-                available = state.value
+            handler = _FAN_INIT_HANDLERS.get(state.functionClass)
+            if handler:
+                handler(hs_device, state, attrs)
 
         self._items[hs_device.id] = Fan(
             hs_device.functions,
             id=hs_device.id,
-            available=available,
-            device_information=DeviceInformation(
-                device_class=hs_device.device_class,
-                default_image=hs_device.default_image,
-                default_name=hs_device.default_name,
-                manufacturer=hs_device.manufacturerName,
-                model=hs_device.model,
-                name=hs_device.friendly_name,
-                parent_id=hs_device.device_id,
-            ),
-            on=on,
-            speed=speed,
-            direction=direction,
-            preset=preset,
+            device_information=DeviceInformation.from_hs_device(hs_device),
+            **attrs,
         )
         return self._items[hs_device.id]
 
     async def update_elem(self, hs_device: HubspaceDevice) -> set:
         updated_keys = set()
         cur_item = self.get_device(hs_device.id)
+        if not self.states_changed(hs_device):
+            return updated_keys
         for state in hs_device.states:
-            if state.functionClass == "power":
-                new_val = state.value == "on"
-                if cur_item.on.on != new_val:
-                    cur_item.on.on = new_val
-                    updated_keys.add("on")
-            elif state.functionClass == "fan-speed":
-                new_val = ordered_list_item_to_percentage(
-                    cur_item.speed.speeds, state.value
-                )
-                if cur_item.speed.speed != new_val:
-                    cur_item.speed.speed = new_val
-                    updated_keys.add("speed")
-            elif state.functionClass == "fan-reverse":
-                new_val = state.value == "forward"
-                if cur_item.direction.forward != new_val:
-                    cur_item.direction.forward = new_val
-                    updated_keys.add("direction")
-            elif (
-                state.functionClass == "toggle"
-                and state.functionInstance in KNOWN_PRESETS
-            ):
-                new_val = state.value == "enabled"
-                if cur_item.preset.enabled != new_val:
-                    cur_item.preset.enabled = new_val
-                    updated_keys.add("preset")
-            elif state.functionClass == "available":
-                if cur_item.available != state.value:
-                    cur_item.available = state.value
-                    updated_keys.add("available")
+            handler = _FAN_UPDATE_HANDLERS.get(state.functionClass)
+            if handler:
+                handler(cur_item, state.value, state.functionInstance, updated_keys)
         return updated_keys
 
     async def set_state(
@@ -167,4 +219,4 @@ class FanController(BaseResourcesController[Fan]):
             )
         if forward is not None and cur_item.direction is not None:
             update_obj.direction = features.DirectionFeature(forward=forward)
-        await self.update(device_id, obj_in=update_obj)
+        await self.update_batched(device_id, update_obj)
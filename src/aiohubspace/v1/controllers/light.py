@@ -1,28 +1,173 @@
 """Controller holding and managing Hubspace resources of type `light`."""
 
 from contextlib import suppress
+from typing import Any, Callable
 
 from ... import device, errors
 from ...device import HubspaceDevice, HubspaceState
-from ...util import process_range
+from ...util import closest_value, process_range
 from ..models import features
 from ..models.light import Light, LightPut
 from ..models.resource import DeviceInformation, ResourceTypes
 from .base import BaseResourcesController
 
 
+def _parse_temp(value: str | int) -> int:
+    """Convert a color temperature, optionally suffixed with K, to an int"""
+    if isinstance(value, str):
+        value = value.removesuffix("K")
+    return int(value)
+
+
 def process_names(values: list[dict]) -> set[str]:
-    vals = set()
-    for val in values:
-        vals.add(val["name"])
-    return vals
+    return {val["name"] for val in values}
+
+
+def _init_power(
+    hs_device: HubspaceDevice, state: HubspaceState, func_defs: dict, attrs: dict
+) -> None:
+    attrs["on"] = features.OnFeature(
+        on=state.value == "on",
+        func_class=state.functionClass,
+        func_instance=state.functionInstance,
+    )
+
+
+def _init_color_temperature(
+    hs_device: HubspaceDevice, state: HubspaceState, func_defs: dict, attrs: dict
+) -> None:
+    func_def = func_defs[(state.functionClass, state.functionInstance)]
+    if len(func_def["values"]) > 1:
+        avail_temps = process_color_temps(func_def["values"])
+    else:
+        avail_temps = process_range(func_def["values"][0])
+    prefix = "K" if func_def.get("type", None) != "numeric" else ""
+    attrs["color_temperature"] = features.ColorTemperatureFeature(
+        temperature=_parse_temp(state.value), supported=avail_temps, prefix=prefix
+    )
+
+
+def _init_brightness(
+    hs_device: HubspaceDevice, state: HubspaceState, func_defs: dict, attrs: dict
+) -> None:
+    func_def = func_defs[(state.functionClass, state.functionInstance)]
+    temp_bright = process_range(func_def["values"][0])
+    attrs["dimming"] = features.DimmingFeature(
+        brightness=int(state.value), supported=temp_bright
+    )
+
+
+def _init_effect(
+    hs_device: HubspaceDevice, state: HubspaceState, func_defs: dict, attrs: dict
+) -> None:
+    # Every color-sequence state shares the effects derived from the functions
+    if attrs["effect"] is not None:
+        effects = attrs["effect"].effects
+    else:
+        effects = process_effects(hs_device.functions)
+    attrs["effect"] = features.EffectFeature(effect=state.value, effects=effects)
+
+
+def _init_color(
+    hs_device: HubspaceDevice, state: HubspaceState, func_defs: dict, attrs: dict
+) -> None:
+    attrs["color"] = features.ColorFeature(
+        red=state.value["color-rgb"].get("r", 0),
+        green=state.value["color-rgb"].get("g", 0),
+        blue=state.value["color-rgb"].get("b", 0),
+    )
+
+
+def _init_color_mode(
+    hs_device: HubspaceDevice, state: HubspaceState, func_defs: dict, attrs: dict
+) -> None:
+    attrs["color_mode"] = features.ColorModeFeature(state.value)
+
+
+def _init_available(
+    hs_device: HubspaceDevice, state: HubspaceState, func_defs: dict, attrs: dict
+) -> None:
+    attrs["available"] = state.value
+
+
+def _update_power(cur_item: Light, state: HubspaceState, updated_keys: set) -> None:
+    new_val = state.value == "on"
+    if cur_item.on.on != new_val:
+        cur_item.on.on = new_val
+        updated_keys.add("on")
+
+
+def _update_color_temperature(
+    cur_item: Light, state: HubspaceState, updated_keys: set
+) -> None:
+    new_val = _parse_temp(state.value)
+    if cur_item.color_temperature.temperature != new_val:
+        cur_item.color_temperature.temperature = new_val
+        updated_keys.add("color_temperature")
+
+
+def _update_brightness(
+    cur_item: Light, state: HubspaceState, updated_keys: set
+) -> None:
+    new_val = int(state.value)
+    if cur_item.dimming.brightness != new_val:
+        cur_item.dimming.brightness = new_val
+        updated_keys.add("dimming")
+
+
+def _update_color(cur_item: Light, state: HubspaceState, updated_keys: set) -> None:
+    rgb = state.value["color-rgb"]
+    new_val = (rgb.get("r", 0), rgb.get("g", 0), rgb.get("b", 0))
+    color = cur_item.color
+    if (color.red, color.green, color.blue) != new_val:
+        color.red, color.green, color.blue = new_val
+        updated_keys.add("color")
+
+
+def _update_color_mode(
+    cur_item: Light, state: HubspaceState, updated_keys: set
+) -> None:
+    if cur_item.color_mode.mode != state.value:
+        cur_item.color_mode.mode = state.value
+        updated_keys.add("color_mode")
+
+
+def _update_available(cur_item: Light, state: HubspaceState, updated_keys: set) -> None:
+    if cur_item.available != state.value:
+        cur_item.available = state.value
+        updated_keys.add("available")
+
+
+# functionClass -> handler that populates the Light attributes from the state
+_LIGHT_INIT_HANDLERS: dict[
+    str, Callable[[HubspaceDevice, HubspaceState, dict, dict], None]
+] = {
+    "power": _init_power,
+    "color-temperature": _init_color_temperature,
+    "brightness": _init_brightness,
+    "color-sequence": _init_effect,
+    "color-rgb": _init_color,
+    "color-mode": _init_color_mode,
+    "available": _init_available,
+}
+
+# functionClass -> handler that applies the state and tracks the updated keys.
+# color-sequence is absent as the effect is derived from all of its states.
+_LIGHT_UPDATE_HANDLERS: dict[str, Callable[[Light, HubspaceState, set], None]] = {
+    "power": _update_power,
+    "color-temperature": _update_color_temperature,
+    "brightness": _update_brightness,
+    "color-rgb": _update_color,
+    "color-mode": _update_color_mode,
+    "available": _update_available,
+}
 
 
 class LightController(BaseResourcesController[Light]):
     """Controller holding and managing Hubspace resources of type `light`."""
 
     ITEM_TYPE_ID = ResourceTypes.DEVICE
-    ITEM_TYPES = [ResourceTypes.LIGHT]
+    ITEM_TYPES = frozenset([ResourceTypes.LIGHT])
     ITEM_CLS = Light
     ITEM_MAPPING = {
         "color": "color-rgb",
@@ -31,6 +176,7 @@ class LightController(BaseResourcesController[Light]):
         "dimming": "brightness",
         "effect": "color-sequence",
     }
+    ITEM_STATES = frozenset(_LIGHT_INIT_HANDLERS) | frozenset(_LIGHT_UPDATE_HANDLERS)
 
     async def turn_on(self, device_id: str) -> None:
         """Turn on the light."""
@@ -62,123 +208,43 @@ class LightController(BaseResourcesController[Light]):
 
     async def initialize_elem(self, hs_device: HubspaceDevice) -> Light:
         """Initialize the element"""
-        available: bool = False
-        on: features.OnFeature | None = None
-        color_temp: features.ColorTemperatureFeature | None = None
-        color: features.ColorFeature | None = None
-        color_mode: features.ColorModeFeature | None = None
-        dimming: features.DimmingFeature | None = None
-        effect: features.EffectFeature | None = None
+        attrs: dict[str, Any] = {
+            "available": False,
+            "on": None,
+            "dimming": None,
+            "color_mode": None,
+            "color_temperature": None,
+            "color": None,
+            "effect": None,
+        }
+        func_defs = device.index_functions(hs_device.functions)
         for state in hs_device.states:
-            func_def = device.get_function_from_device(
-                hs_device.functions, state.functionClass, state.functionInstance
-            )
-            if state.functionClass == "power":
-                on = features.OnFeature(
-                    on=state.value == "on",
-                    func_class=state.functionClass,
-                    func_instance=state.functionInstance,
-                )
-            elif state.functionClass == "color-temperature":
-                if len(func_def["values"]) > 1:
-                    avail_temps = process_color_temps(func_def["values"])
-                else:
-                    avail_temps = process_range(func_def["values"][0])
-                prefix = "K" if func_def.get("type", None) != "numeric" else ""
-                current_temp = state.value
-                if isinstance(current_temp, str) and current_temp.endswith("K"):
-                    current_temp = current_temp[:-1]
-                color_temp = features.ColorTemperatureFeature(
-                    temperature=int(current_temp), supported=avail_temps, prefix=prefix
-                )
-            elif state.functionClass == "brightness":
-                temp_bright = process_range(func_def["values"][0])
-                dimming = features.DimmingFeature(
-                    brightness=int(state.value), supported=temp_bright
-                )
-            elif state.functionClass == "color-sequence":
-                current_effect = state.value
-                effects = process_effects(hs_device.functions)
-                effect = features.EffectFeature(effect=current_effect, effects=effects)
-            elif state.functionClass == "color-rgb":
-                color = features.ColorFeature(
-                    red=state.value["color-rgb"].get("r", 0),
-                    green=state.value["color-rgb"].get("g", 0),
-                    blue=state.value["color-rgb"].get("b", 0),
-                )
-            elif state.functionClass == "color-mode":
-                color_mode = features.ColorModeFeature(state.value)
-            elif state.functionClass == "available":
-                available = state.value
+            handler = _LIGHT_INIT_HANDLERS.get(state.functionClass)
+            if handler:
+                handler(hs_device, state, func_defs, attrs)
 
         self._items[hs_device.id] = Light(
             hs_device.functions,
             id=hs_device.id,
-            available=available,
-            device_information=DeviceInformation(
-                device_class=hs_device.device_class,
-                default_image=hs_device.default_image,
-                default_name=hs_device.default_name,
-                manufacturer=hs_device.manufacturerName,
-                model=hs_device.model,
-                name=hs_device.friendly_name,
-                parent_id=hs_device.device_id,
-            ),
-            on=on,
-            dimming=dimming,
-            color_mode=color_mode,
-            color_temperature=color_temp,
-            color=color,
-            effect=effect,
+            device_information=DeviceInformation.from_hs_device(hs_device),
+            **attrs,
         )
         return self._items[hs_device.id]
 
     async def update_elem(self, hs_device: HubspaceDevice) -> set:
         cur_item = self.get_device(hs_device.id)
         updated_keys = set()
+        if not self.states_changed(hs_device):
+            return updated_keys
         color_seq_states: dict[str, HubspaceState] = {}
         for state in hs_device.states:
-            if state.functionClass == "power":
-                new_val = state.value == "on"
-                if cur_item.on.on != new_val:
-                    cur_item.on.on = new_val
-                    updated_keys.add("on")
-            elif state.functionClass == "color-temperature":
-                current_temp = state.value
-                if isinstance(current_temp, str) and current_temp.endswith("K"):
-                    current_temp = current_temp[:-1]
-                new_val = int(current_temp)
-                if cur_item.color_temperature.temperature != new_val:
-                    cur_item.color_temperature.temperature = new_val
-                    updated_keys.add("color_temperature")
-            elif state.functionClass == "brightness":
-                new_val = int(state.value)
-                if cur_item.dimming.brightness != new_val:
-                    cur_item.dimming.brightness = int(state.value)
-                    updated_keys.add("dimming")
-            elif state.functionClass == "color-sequence":
+            func_class = state.functionClass
+            if func_class == "color-sequence":
                 color_seq_states[state.functionInstance] = state
-            elif state.functionClass == "color-rgb":
-                color_red = state.value["color-rgb"].get("r", 0)
-                color_green = state.value["color-rgb"].get("g", 0)
-                color_blue = state.value["color-rgb"].get("b", 0)
-                if (
-                    cur_item.color.red != color_red
-                    or cur_item.color.green != color_green
-                    or cur_item.color.blue != color_blue
-                ):
-                    cur_item.color.red = color_red
-                    cur_item.color.green = color_green
-                    cur_item.color.blue = color_blue
-                    updated_keys.add("color")
-            elif state.functionClass == "color-mode":
-                if cur_item.color_mode.mode != state.value:
-                    cur_item.color_mode.mode = state.value
-                    updated_keys.add("color_mode")
-            elif state.functionClass == "available":
-                if cur_item.available != state.value:
-                    cur_item.available = state.value
-                    updated_keys.add("available")
+                continue
+            handler = _LIGHT_UPDATE_HANDLERS.get(func_class)
+            if handler:
+                handler(cur_item, state, updated_keys)
         # Several states hold the effect, but its always derived from the preset functionInstance
         updated_keys = updated_keys.union(
             await self.update_elem_color(cur_item, color_seq_states)
@@ -194,11 +260,10 @@ class LightController(BaseResourcesController[Light]):
                     cur_item.effect.effect = preset_val
                     updated_keys.add("effect")
             else:
-                new_val = color_seq_states[color_seq_states["preset"].value].value
-                if cur_item.effect.effect != new_val:
-                    cur_item.effect.effect = color_seq_states[
-                        color_seq_states["preset"].value
-                    ].value
+                target = color_seq_states.get(preset_val)
+                new_val = target.value if target else None
+                if new_val is not None and cur_item.effect.effect != new_val:
+                    cur_item.effect.effect = new_val
                     updated_keys.add("effect")
         return updated_keys
 
@@ -226,9 +291,8 @@ class LightController(BaseResourcesController[Light]):
                 func_instance=cur_item.on.func_instance,
             )
         if temperature is not None and cur_item.color_temperature is not None:
-            adjusted_temp = min(
-                cur_item.color_temperature.supported,
-                key=lambda x: abs(x - temperature),
+            adjusted_temp = closest_value(
+                cur_item.color_temperature.supported, temperature
             )
             update_obj.color_temperature = features.ColorTemperatureFeature(
                 temperature=adjusted_temp,
@@ -249,7 +313,7 @@ class LightController(BaseResourcesController[Light]):
             update_obj.effect = features.EffectFeature(
                 effect=effect, effects=cur_item.effect.effects
             )
-        await self.update(device_id, obj_in=update_obj)
+        await self.update_batched(device_id, update_obj)
 
 
 def process_color_temps(color_temps: dict) -> list[int]:
@@ -257,13 +321,7 @@ def process_color_temps(color_temps: dict) -> list[int]:
 
     :param color_temps: Result from functions["values"]
     """
-    supported_temps = []
-    for temp in color_temps:
-        color_temp = temp["name"]
-        if isinstance(color_temp, str) and color_temp.endswith("K"):
-            color_temp = color_temp[0:-1]
-        supported_temps.append(int(color_temp))
-    return sorted(supported_temps)
+    return sorted(_parse_temp(temp["name"]) for temp in color_temps)
 
 
 def process_effects(functions: list[dict]) -> dict[str, set]:
@@ -271,9 +329,9 @@ def process_effects(functions: list[dict]) -> dict[str, set]:
     supported_effects = {}
     for function in functions:
         if function["functionClass"] == "color-sequence":
-            supported_effects[function["functionInstance"]] = set(
-                process_names(function["values"])
-            )
+            supported_effects[function["functionInstance"]] = {
+                val["name"] for val in function["values"]
+            }
     # custom shouldnt be a value in preset
     with suppress(KeyError):
         supported_effects["preset"].remove("custom")
@@ -11,9 +11,10 @@ class LockController(BaseResourcesController[Lock]):
     """Controller holding and managing Hubspace resources of type `lock`."""
 
     ITEM_TYPE_ID = ResourceTypes.DEVICE
-    ITEM_TYPES = [ResourceTypes.LOCK]
+    ITEM_TYPES = frozenset([ResourceTypes.LOCK])
     ITEM_CLS = Lock
     ITEM_MAPPING = {"position": "lock-control"}
+    ITEM_STATES = frozenset(["available", "lock-control"])
 
     async def lock(self, device_id: str) -> None:
         """Engage the lock"""
@@ -43,15 +44,7 @@ class LockController(BaseResourcesController[Lock]):
             hs_device.functions,
             id=hs_device.id,
             available=available,
-            device_information=DeviceInformation(
-                device_class=hs_device.device_class,
-                default_image=hs_device.default_image,
-                default_name=hs_device.default_name,
-                manufacturer=hs_device.manufacturerName,
-                model=hs_device.model,
-                name=hs_device.friendly_name,
-                parent_id=hs_device.device_id,
-            ),
+            device_information=DeviceInformation.from_hs_device(hs_device),
             position=current_position,
         )
         return self._items[hs_device.id]
@@ -16,13 +16,16 @@ class SwitchController(BaseResourcesController[Switch]):
     """
 
     ITEM_TYPE_ID = ResourceTypes.DEVICE
-    ITEM_TYPES = [
-        ResourceTypes.SWITCH,
-        ResourceTypes.POWER_OUTLET,
-        ResourceTypes.LANDSCAPE_TRANSFORMER,
-    ]
+    ITEM_TYPES = frozenset(
+        [
+            ResourceTypes.SWITCH,
+            ResourceTypes.POWER_OUTLET,
+            ResourceTypes.LANDSCAPE_TRANSFORMER,
+        ]
+    )
     ITEM_CLS = Switch
     ITEM_MAPPING = {}
+    ITEM_STATES = frozenset(["available", "power", "toggle"])
 
     async def turn_on(self, device_id: str, instance: str | None = None) -> None:
         """Turn on the switch."""
@@ -50,15 +53,7 @@ class SwitchController(BaseResourcesController[Switch]):
             hs_device.functions,
             id=hs_device.id,
             available=available,
-            device_information=DeviceInformation(
-                device_class=hs_device.device_class,
-                default_image=hs_device.default_image,
-                default_name=hs_device.default_name,
-                manufacturer=hs_device.manufacturerName,
-                model=hs_device.model,
-                name=hs_device.friendly_name,
-                parent_id=hs_device.device_id,
-            ),
+            device_information=DeviceInformation.from_hs_device(hs_device),
             on=on,
         )
         return self._items[hs_device.id]
@@ -16,9 +16,10 @@ class ValveController(BaseResourcesController[Valve]):
     """
 
     ITEM_TYPE_ID = ResourceTypes.DEVICE
-    ITEM_TYPES = [ResourceTypes.WATER_TIMER]
+    ITEM_TYPES = frozenset([ResourceTypes.WATER_TIMER])
     ITEM_CLS = Valve
     ITEM_MAPPING = {}
+    ITEM_STATES = frozenset(["available", "power", "toggle"])
 
     async def turn_on(self, device_id: str, instance: str | None = None) -> None:
         """Open the valve"""
@@ -47,15 +48,7 @@ class ValveController(BaseResourcesController[Valve]):
             hs_device.functions,
             id=hs_device.id,
             available=available,
-            device_information=DeviceInformation(
-                device_class=hs_device.device_class,
-                default_image=hs_device.default_image,
-                default_name=hs_device.default_name,
-                manufacturer=hs_device.manufacturerName,
-                model=hs_device.model,
-                name=hs_device.friendly_name,
-                parent_id=hs_device.device_id,
-            ),
+            device_information=DeviceInformation.from_hs_device(hs_device),
             open=valve_open,
         )
         return self._items[hs_device.id]
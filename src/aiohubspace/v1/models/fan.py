@@ -1,38 +1,31 @@
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 
 from ..models import features
-from .resource import DeviceInformation, ResourceTypes
+from .resource import DeviceInformation, ResourceTypes, build_instances
 
 
-@dataclass
+@dataclass(slots=True)
 class Fan:
     """Representation of a Hubspace Fan"""
 
+    functions: InitVar[list]  # Used to determine the instances
     id: str  # ID used when interacting with Hubspace
     available: bool
 
     on: features.OnFeature
-    speed: features.SpeedFeature | None
-    direction: features.DirectionFeature | None
-    preset: features.PresetFeature | None
+    speed: features.SpeedFeature | None = None
+    direction: features.DirectionFeature | None = None
+    preset: features.PresetFeature | None = None
 
     # Defined at initialization
-    instances: dict = field(default_factory=lambda: dict(), repr=False, init=False)
+    # Accepted for backwards compatibility but always rebuilt from functions
+    instances: dict = field(default=None, repr=False, kw_only=True)
     device_information: DeviceInformation = field(default_factory=DeviceInformation)
 
     type: ResourceTypes = ResourceTypes.FAN
 
-    def __init__(self, functions: list, **kwargs):
-        for key, value in kwargs.items():
-            if key == "instances":
-                continue
-            setattr(self, key, value)
-        instances = {}
-        for function in functions:
-            instances[function["functionClass"]] = function.get(
-                "functionInstance", None
-            )
-        self.instances = instances
+    def __post_init__(self, functions: list):
+        self.instances = build_instances(functions)
 
     def get_instance(self, elem):
         """Lookup the instance associated with the elem"""
@@ -84,7 +77,7 @@ class Fan:
             return None
 
 
-@dataclass
+@dataclass(slots=True)
 class FanPut:
     """States that can be updated for a Fan"""
 
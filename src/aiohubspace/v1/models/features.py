@@ -6,7 +6,7 @@ from enum import Enum
 from ...util import percentage_to_ordered_list_item
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorModeFeature:
     """Represent the current mode (ie white, color) Feature object"""
 
@@ -17,7 +17,7 @@ class ColorModeFeature:
         return self.mode
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorFeature:
     """Represent `RGB` Feature object"""
 
@@ -38,7 +38,7 @@ class ColorFeature:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ColorTemperatureFeature:
     """Represent Current temperature Feature"""
 
@@ -65,7 +65,7 @@ class CurrentPositionEnum(Enum):
         return cls.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class CurrentPositionFeature:
     """Represents the current position of the lock"""
 
@@ -76,7 +76,7 @@ class CurrentPositionFeature:
         return self.position.value
 
 
-@dataclass
+@dataclass(slots=True)
 class DimmingFeature:
     """Represent Current temperature Feature"""
 
@@ -88,7 +88,7 @@ class DimmingFeature:
         return self.brightness
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectionFeature:
     """Represent Current Fan direction Feature"""
 
@@ -99,7 +99,7 @@ class DirectionFeature:
         return "forward" if self.forward else "reverse"
 
 
-@dataclass
+@dataclass(slots=True)
 class EffectFeature:
     """Represent the current effect"""
 
@@ -141,7 +141,7 @@ class EffectFeature:
             return False
 
 
-@dataclass
+@dataclass(slots=True)
 class ModeFeature:
     """Represent Current Fan mode Feature"""
 
@@ -153,7 +153,7 @@ class ModeFeature:
         return self.mode
 
 
-@dataclass
+@dataclass(slots=True)
 class OnFeature:
     """Represent `On` Feature object as used by various Hubspace resources."""
 
@@ -172,7 +172,7 @@ class OnFeature:
         return state
 
 
-@dataclass
+@dataclass(slots=True)
 class OpenFeature:
     """Represent `Open` Feature object"""
 
@@ -191,7 +191,7 @@ class OpenFeature:
         return state
 
 
-@dataclass
+@dataclass(slots=True)
 class PresetFeature:
     """Represent the current preset"""
 
@@ -208,12 +208,20 @@ class PresetFeature:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SpeedFeature:
     """Represent Current Fan speed Feature"""
 
     speed: int
     speeds: list[str]
+    # Percentage of each speed, derived from speeds
+    percentages: dict[str, int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self.percentages = {
+            speed: (ind * 100) // len(self.speeds)
+            for ind, speed in enumerate(self.speeds, start=1)
+        }
 
     @property
     def hs_value(self):
@@ -1,40 +1,33 @@
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 
 from ..models import features
-from .resource import DeviceInformation, ResourceTypes
+from .resource import DeviceInformation, ResourceTypes, build_instances
 
 
-@dataclass
+@dataclass(slots=True)
 class Light[HubspaceResource]:
     """Representation of a Hubspace Light"""
 
+    functions: InitVar[list]  # Used to determine the instances
     id: str  # ID used when interacting with Hubspace
     available: bool
 
-    on: features.OnFeature | None
-    color: features.ColorFeature | None
-    color_mode: features.ColorModeFeature | None
-    color_temperature: features.ColorTemperatureFeature | None
-    dimming: features.DimmingFeature | None
-    effect: features.EffectFeature | None
+    on: features.OnFeature | None = None
+    color: features.ColorFeature | None = None
+    color_mode: features.ColorModeFeature | None = None
+    color_temperature: features.ColorTemperatureFeature | None = None
+    dimming: features.DimmingFeature | None = None
+    effect: features.EffectFeature | None = None
 
     # Defined at initialization
-    instances: dict = field(default_factory=lambda: dict(), repr=False, init=False)
+    # Accepted for backwards compatibility but always rebuilt from functions
+    instances: dict = field(default=None, repr=False, kw_only=True)
     device_information: DeviceInformation = field(default_factory=DeviceInformation)
 
     type: ResourceTypes = ResourceTypes.LIGHT
 
-    def __init__(self, functions: list, **kwargs):
-        for key, value in kwargs.items():
-            if key == "instances":
-                continue
-            setattr(self, key, value)
-        instances = {}
-        for function in functions:
-            instances[function["functionClass"]] = function.get(
-                "functionInstance", None
-            )
-        self.instances = instances
+    def __post_init__(self, functions: list):
+        self.instances = build_instances(functions)
 
     def get_instance(self, elem):
         """Lookup the instance associated with the elem"""
@@ -79,7 +72,7 @@ class Light[HubspaceResource]:
         return 100.0 if self.is_on else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class LightPut[HubspaceResource]:
     """States that can be updated for a light"""
 
@@ -1,11 +1,13 @@
 """Generic/base Resource Model(s)."""
 
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
+from ...device import HubspaceDevice
 
-class ResourceTypes(Enum):
+
+class ResourceTypes(StrEnum):
     """
     Type of the supported resources
     """
@@ -29,7 +31,7 @@ class ResourceTypes(Enum):
         return ResourceTypes.UNKNOWN
 
 
-@dataclass
+@dataclass(slots=True)
 class DeviceInformation:
 
     device_class: Optional[str] = None
@@ -41,3 +43,40 @@ class DeviceInformation:
     parent_id: Optional[str] = None
     wifi_mac: Optional[str] = None
     ble_mac: Optional[str] = None
+
+    @classmethod
+    def from_hs_device(
+        cls,
+        hs_device: HubspaceDevice,
+        wifi_mac: Optional[str] = None,
+        ble_mac: Optional[str] = None,
+    ) -> "DeviceInformation":
+        """Generate the device information from a Hubspace device
+
+        :param hs_device: Device to pull the information from
+        :param wifi_mac: MAC address of the WiFi interface. Default: None
+        :param ble_mac: MAC address of the Bluetooth interface. Default: None
+        """
+        # Positional to match the field order and avoid building kwargs
+        return cls(
+            hs_device.device_class,
+            hs_device.default_image,
+            hs_device.default_name,
+            hs_device.manufacturerName,
+            hs_device.model,
+            hs_device.friendly_name,
+            hs_device.device_id,
+            wifi_mac,
+            ble_mac,
+        )
+
+
+def build_instances(functions: list[dict]) -> dict[str, str | None]:
+    """Map each functionClass to the functionInstance of its last function
+
+    :param functions: Functions from the Hubspace device
+    """
+    return {
+        function["functionClass"]: function.get("functionInstance")
+        for function in functions
+    }
@@ -1,13 +1,13 @@
 from dataclasses import dataclass, field
 
-MAPPED_SENSORS = [
+MAPPED_SENSORS: set[str] = {
     "battery-level",
     "output-voltage-switch",
     "watts",
     "wifi-rssi",
-]
+}
 
-BINARY_SENSORS = ["error"]
+BINARY_SENSORS: set[str] = {"error"}
 
 
 @dataclass
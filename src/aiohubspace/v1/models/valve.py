@@ -1,41 +1,34 @@
-from dataclasses import dataclass, field
+from dataclasses import InitVar, dataclass, field
 
 from ..models import features
-from .resource import DeviceInformation, ResourceTypes
+from .resource import DeviceInformation, ResourceTypes, build_instances
 
 
-@dataclass
+@dataclass(slots=True)
 class Valve:
     """Representation of a Hubspace Valve"""
 
+    functions: InitVar[list]  # Used to determine the instances
     id: str  # ID used when interacting with Hubspace
     available: bool
 
     open: dict[str | None, features.OpenFeature]
     # Defined at initialization
-    instances: dict = field(default_factory=lambda: dict(), repr=False, init=False)
+    # Accepted for backwards compatibility but always rebuilt from functions
+    instances: dict = field(default=None, repr=False, kw_only=True)
     device_information: DeviceInformation = field(default_factory=DeviceInformation)
 
     type: ResourceTypes = ResourceTypes.WATER_TIMER
 
-    def __init__(self, functions: list, **kwargs):
-        for key, value in kwargs.items():
-            if key == "instances":
-                continue
-            setattr(self, key, value)
-        instances = {}
-        for function in functions:
-            instances[function["functionClass"]] = function.get(
-                "functionInstance", None
-            )
-        self.instances = instances
+    def __post_init__(self, functions: list):
+        self.instances = build_instances(functions)
 
     def get_instance(self, elem):
         """Lookup the instance associated with the elem"""
         return self.instances.get(elem, None)
 
 
-@dataclass
+@dataclass(slots=True)
 class ValvePut:
     """States that can be updated for a Switch"""
 
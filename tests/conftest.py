@@ -1,3 +1,4 @@
+import asyncio
 import datetime
 
 import pytest
@@ -8,6 +9,8 @@ from aiohubspace.v1 import HubspaceBridgeV1
 from aiohubspace.v1.auth import token_data
 from aiohubspace.v1.controllers.event import EventType
 
+from .v1 import utils
+
 
 @pytest.fixture
 def mocked_bridge(mocker):
@@ -73,7 +76,22 @@ async def bridge(mocker):
     mocker.patch.object(bridge, "request", side_effect=mocker.AsyncMock())
     await bridge.initialize()
     yield bridge
+    # stop() only cancels, so wait for the tasks to unwind before the loop closes
+    bg_tasks = list(bridge.events._bg_tasks)
     await bridge.close()
+    await asyncio.gather(*bg_tasks, return_exceptions=True)
+
+
+@pytest.fixture(scope="session")
+def raw_hs_data():
+    """Parsed raw_hs_data.json, shared across the session. Do not modify"""
+    return utils.get_raw_dump("raw_hs_data.json")
+
+
+@pytest.fixture(scope="session")
+def water_timer_raw():
+    """Parsed water-timer-raw.json, shared across the session. Do not modify"""
+    return utils.get_raw_dump("water-timer-raw.json")
 
 
 @pytest.fixture
@@ -1,4 +1,5 @@
 from dataclasses import replace
+from uuid import UUID
 
 import pytest
 
@@ -87,7 +88,7 @@ def mock_uuid(mocker):
         else:
             return "its-a-2"
 
-    mocker.patch.object(anonomyize_data, "uuid4", side_effect=get_uuid)
+    mocker.patch.object(anonomyize_data, "_fast_uuid4", side_effect=get_uuid)
 
 
 @pytest.mark.parametrize(
@@ -157,7 +158,7 @@ def mock_uuid(mocker):
     ],
 )
 def test_anonymize_state(state, only_geo, expected, mocker):
-    mocker.patch.object(anonomyize_data, "uuid4", return_value="anon data")
+    mocker.patch.object(anonomyize_data, "_fast_uuid4", return_value="anon data")
     assert anonomyize_data.anonymize_state(state, only_geo=only_geo) == expected
 
 
@@ -225,8 +226,9 @@ def test_anonymize_state(state, only_geo, expected, mocker):
     ],
 )
 def test_anonymize_device(
-    device, device_links, parent_mapping, anon_name, expected, mock_uuid
+    device, device_links, parent_mapping, anon_name, expected, mock_uuid, mocker
 ):
+    mocker.patch.object(anonomyize_data, "FNAME_IND", 0)
     anon_dev = anonomyize_data.anonymize_device(
         device, parent_mapping, device_links, anon_name
     )
@@ -236,6 +238,15 @@ def test_anonymize_device(
         assert anon_dev[key] == val
 
 
+def test_anonymize_device_unique_names(mocker):
+    mocker.patch.object(anonomyize_data, "FNAME_IND", 0)
+    names = [
+        anonomyize_data.anonymize_device(dev, {}, {}, True)["friendly_name"]
+        for dev in [child_dev_1, child_dev_2]
+    ]
+    assert names == ["friendly-device-0", "friendly-device-1"]
+
+
 @pytest.mark.parametrize(
     "devices, expected, new_children",
     [
@@ -359,12 +370,25 @@ def test_anonymize_devices(anon_name, mock_uuid):
         },
     ]
     if anon_name:
-        expected[0]["friendly_name"] = "friendly-device-1"
-        expected[1]["friendly_name"] = "friendly-device-2"
-        expected[2]["friendly_name"] = "friendly-device-3"
+        expected[0]["friendly_name"] = "friendly-device-0"
+        expected[1]["friendly_name"] = "friendly-device-1"
+        expected[2]["friendly_name"] = "friendly-device-2"
     assert (
         anonomyize_data.anonymize_devices(
             [parent_dev_1, child_dev_1, child_dev_2], anon_name=anon_name
         )
         == expected
     )
+
+
+def test_fast_uuid4(mocker):
+    mocker.patch.object(anonomyize_data, "_uuid_pool", bytearray())
+    mocker.patch.object(anonomyize_data, "_uuid_pool_pos", 0)
+    mocker.patch.object(anonomyize_data, "_UUID_POOL_SIZE", 32)
+    generated = [anonomyize_data._fast_uuid4() for _ in range(3)]
+    assert len(set(generated)) == 3
+    # Two UUIDs per pool, so the third came from a refilled pool
+    assert anonomyize_data._uuid_pool_pos == 16
+    for val in generated:
+        assert UUID(val).version == 4
+        assert str(UUID(val)) == val
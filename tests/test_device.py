@@ -1,5 +1,6 @@
 import json
 import os
+import sys
 
 import pytest
 
@@ -537,6 +538,24 @@ def test_HubspaceState(data, expected_attrs):
         assert getattr(elem, key) == val
 
 
+def test_get_hs_device_function_classes():
+    dev = device.get_hs_device(
+        device_lock_response[0], function_classes=frozenset(["available"])
+    )
+    assert [state.functionClass for state in dev.states] == ["available"]
+    assert dev.functions == device_lock_response[0]["description"]["functions"]
+
+
+def test_get_hs_device_interned():
+    dev = device.get_hs_device(device_lock_response[0])
+    assert dev.device_class is sys.intern("door-lock")
+    assert dev.default_image is sys.intern("keypad-deadbolt-lock-icon")
+    for state in dev.states:
+        assert state.functionClass is sys.intern(state.functionClass)
+        if state.functionInstance is not None:
+            assert state.functionInstance is sys.intern(state.functionInstance)
+
+
 def test_HubspaceDevice_hash():
     dev = device.get_hs_device(device_lock_response[0])
     hash_check = {dev: True}
@@ -556,3 +575,17 @@ def test_get_function_from_device(functions, func_class, func_instance, expected
         device.get_function_from_device(functions, func_class, func_instance)
         == expected
     )
+
+
+@pytest.mark.parametrize(
+    "func_class, func_instance, expected",
+    [
+        ("cool", "beans", None),
+        ("lock-pin", None, None),
+        ("lock-pin", "lock-pin-9", lock_dev.functions[19]),
+    ],
+)
+def test_index_functions(func_class, func_instance, expected):
+    index = device.index_functions(lock_dev.functions)
+    assert index.get((func_class, func_instance)) == expected
+    assert len(index) <= len(lock_dev.functions)
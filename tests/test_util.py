@@ -9,6 +9,11 @@ from aiohubspace import util
         ([], None, None, True),
         ([1, 2, 3], 50, 2, False),
         ([1, 2, 3], 101, 3, False),
+        ([1, 2, 3], 0, 1, False),
+        ([1, 2, 3], 33, 1, False),
+        ([1, 2, 3], 34, 2, False),
+        ([1, 2, 3, 4], 25, 1, False),
+        ([1, 2, 3, 4], 26, 2, False),
     ],
 )
 def test_percentage_to_ordered_list_item(vals, percentage, expected, err):
@@ -44,3 +49,25 @@ def test_ordered_list_item_to_percentage(vals, value, expected, err):
 )
 def test_process_range(range_vals, expected):
     assert util.process_range(range_vals) == expected
+
+
+@pytest.mark.parametrize(
+    "vals, value, expected, err",
+    [
+        ([], 1, None, True),
+        ([2700], 6500, 2700, False),
+        ([2700, 3000, 3500], 2000, 2700, False),
+        ([2700, 3000, 3500], 4000, 3500, False),
+        ([2700, 3000, 3500], 3000, 3000, False),
+        ([2700, 3000, 3500], 3200, 3000, False),
+        ([2700, 3000, 3500], 3300, 3500, False),
+        # Ties go to the lower value
+        ([2700, 3000, 3500], 3250, 3000, False),
+    ],
+)
+def test_closest_value(vals, value, expected, err):
+    if not err:
+        assert util.closest_value(vals, value) == expected
+    else:
+        with pytest.raises(ValueError):
+            util.closest_value(vals, value)
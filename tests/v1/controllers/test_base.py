@@ -1,5 +1,8 @@
+import asyncio
 import logging
+import time
 from dataclasses import dataclass, field, replace
+from unittest.mock import ANY
 
 import pytest
 
@@ -11,8 +14,6 @@ from aiohubspace.v1.controllers import event
 from aiohubspace.v1.controllers.base import BaseResourcesController, update_dataclass
 from aiohubspace.v1.models.resource import DeviceInformation
 
-from .. import utils
-
 
 @dataclass
 class TestFeatureBool:
@@ -433,37 +434,42 @@ def mocked_get_filtered_devices(initial_data) -> list[HubspaceDevice]:
         ),
     ],
 )
-async def test__get_valid_devices(get_filtered_devices, expected_ids, ex1_rc):
-    data = utils.get_raw_dump("raw_hs_data.json")
+async def test__get_valid_devices(
+    get_filtered_devices, expected_ids, ex1_rc, raw_hs_data
+):
     if get_filtered_devices:
         ex1_rc.get_filtered_devices = get_filtered_devices
-    devices = await ex1_rc._get_valid_devices(data)
+    devices = await ex1_rc._get_valid_devices(raw_hs_data)
     assert len(devices) == len(expected_ids)
     for device in devices:
         assert device.id in expected_ids
 
 
 @pytest.mark.asyncio
-async def test_initialize_not_needed(ex1_rc, mocker):
+async def test_initialize_not_needed(ex1_rc, mocker, raw_hs_data):
     check = mocker.patch.object(ex1_rc, "_get_valid_devices")
     ex1_rc._initialized = True
-    await ex1_rc.initialize(utils.get_raw_dump("raw_hs_data.json"))
+    await ex1_rc.initialize(raw_hs_data)
     check.assert_not_called()
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize("item_types", [True, False])
-async def test_initialize(item_types, ex1_rc, mocker):
+async def test_initialize(item_types, ex1_rc, mocker, raw_hs_data):
     ex1_rc._initialized = False
     if not item_types:
         ex1_rc.ITEM_TYPES = []
     handle_event = mocker.patch.object(ex1_rc, "_handle_event")
-    await ex1_rc.initialize(utils.get_raw_dump("raw_hs_data.json"))
+    await ex1_rc.initialize(raw_hs_data)
     assert handle_event.call_count == 3
     if item_types:
-        assert ex1_rc._bridge.events._subscribers == [(handle_event, None, ("light",))]
+        assert ex1_rc._bridge.events._subscribers == {
+            event.EVENT_FILTER_ALL: [(ANY, handle_event, frozenset({"light"}), True)]
+        }
     else:
-        assert ex1_rc._bridge.events._subscribers == [(handle_event, None, None)]
+        assert ex1_rc._bridge.events._subscribers == {
+            event.EVENT_FILTER_ALL: [(ANY, handle_event, None, True)]
+        }
 
 
 @pytest.mark.parametrize(
@@ -663,6 +669,28 @@ async def test_update_hubspace_api(
         assert message in caplog.text
 
 
+@pytest.mark.asyncio
+async def test_update_hubspace_api_concurrency(ex1_rc, mocker):
+    ex1_rc._update_sem = asyncio.Semaphore(2)
+    running = 0
+    max_running = 0
+
+    async def request(*args, **kwargs):
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return mocker.Mock(status=200)
+
+    ex1_rc._bridge.request.side_effect = request
+    results = await asyncio.gather(
+        *(ex1_rc.update_hubspace_api(f"dev-{ind}", []) for ind in range(5))
+    )
+    assert results == [True] * 5
+    assert max_running == 2
+
+
 @pytest.mark.asyncio
 async def test_update_dev_not_found(ex1_rc, caplog):
     caplog.set_level(logging.DEBUG)
@@ -735,9 +763,16 @@ async def test_update_dev_not_found(ex1_rc, caplog):
     ],
 )
 async def test_update(
-    obj_in, states, expected_states, expected_item, successful, ex1_rc, mocker
+    obj_in,
+    states,
+    expected_states,
+    expected_item,
+    successful,
+    ex1_rc,
+    mocker,
+    monkeypatch,
 ):
-    mocker.patch("time.time", return_value=12345)
+    monkeypatch.setattr(time, "time", lambda: 12345)
     ex1_rc._items[test_res.id] = await ex1_rc.initialize_elem(test_device)
     ex1_rc._bridge.add_device(test_res.id, ex1_rc)
     update_hubspace_api = mocker.patch.object(
@@ -751,6 +786,104 @@ async def test_update(
     assert ex1_rc._items[test_res.id] == expected_item
 
 
+@pytest.mark.asyncio
+async def test_states_changed(ex1_rc, mocker, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 12345)
+    ex1_rc._items[test_res.id] = await ex1_rc.initialize_elem(test_device)
+    assert ex1_rc.states_changed(test_device) is True
+    assert ex1_rc.states_changed(test_device) is False
+    assert ex1_rc.states_changed(replace(test_device, states=[])) is True
+    assert ex1_rc.states_changed(test_device) is True
+    # Local updates invalidate the last seen states
+    mocker.patch.object(ex1_rc, "update_hubspace_api", return_value=True)
+    ex1_rc._bridge.events._last_update[test_res.id] = 1000
+    await ex1_rc.update(
+        test_res.id,
+        obj_in=TestResourcePut(on=TestFeatureBool(on=False), beans=None),
+    )
+    assert ex1_rc.states_changed(test_device) is True
+    assert test_res.id not in ex1_rc._bridge.events._last_update
+
+
+@pytest.mark.asyncio
+async def test_update_batched(ex1_rc, mocker):
+    update = mocker.patch.object(ex1_rc, "update")
+    await asyncio.gather(
+        ex1_rc.update_batched(
+            "cool", TestResourcePut(on=TestFeatureBool(on=False), beans=None)
+        ),
+        ex1_rc.update_batched(
+            "cool",
+            TestResourcePut(
+                on=None, beans=TestFeatureInstance(on=True, func_instance="bean2")
+            ),
+        ),
+        ex1_rc.update_batched(
+            "beans", TestResourcePut(on=TestFeatureBool(on=True), beans=None)
+        ),
+    )
+    assert update.call_args_list == [
+        mocker.call(
+            "cool",
+            obj_in=TestResourcePut(
+                on=TestFeatureBool(on=False),
+                beans=TestFeatureInstance(on=True, func_instance="bean2"),
+            ),
+        ),
+        mocker.call(
+            "beans", obj_in=TestResourcePut(on=TestFeatureBool(on=True), beans=None)
+        ),
+    ]
+    assert ex1_rc._pending_updates == {}
+    # Updates after the batch was sent are not merged into it
+    await ex1_rc.update_batched(
+        "cool", TestResourcePut(on=TestFeatureBool(on=True), beans=None)
+    )
+    assert update.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_update_batched_cancelled(ex1_rc, mocker):
+    update = mocker.patch.object(ex1_rc, "update")
+    first = asyncio.create_task(
+        ex1_rc.update_batched(
+            "cool", TestResourcePut(on=TestFeatureBool(on=False), beans=None)
+        )
+    )
+    await asyncio.sleep(0)
+    second = asyncio.create_task(
+        ex1_rc.update_batched(
+            "cool", TestResourcePut(on=TestFeatureBool(on=True), beans=None)
+        )
+    )
+    await asyncio.sleep(0)
+    first.cancel()
+    # The merged caller must not report success for an update never sent
+    with pytest.raises(asyncio.CancelledError):
+        await second
+    assert first.cancelled()
+    update.assert_not_called()
+    assert ex1_rc._pending_updates == {}
+
+
+@pytest.mark.asyncio
+async def test_update_batched_error(ex1_rc, mocker):
+    update = mocker.patch.object(ex1_rc, "update", side_effect=KeyError("kaboom"))
+    results = await asyncio.gather(
+        ex1_rc.update_batched(
+            "cool", TestResourcePut(on=TestFeatureBool(on=False), beans=None)
+        ),
+        ex1_rc.update_batched(
+            "cool", TestResourcePut(on=TestFeatureBool(on=True), beans=None)
+        ),
+        return_exceptions=True,
+    )
+    update.assert_called_once()
+    assert len(results) == 2
+    assert all(isinstance(res, KeyError) for res in results)
+    assert ex1_rc._pending_updates == {}
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     "starting_items,device_id,expected",
@@ -1,4 +1,5 @@
 import asyncio
+import time
 
 import pytest
 
@@ -14,104 +15,112 @@ a21_light = utils.create_devices_from_data("light-a21.json")[0]
 zandra_light = utils.create_devices_from_data("fan-ZandraFan.json")[1]
 freezer = utils.create_devices_from_data("freezer.json")[0]
 
+A21_EXPECTED_SENSORS = {
+    "wifi-rssi": HubspaceSensor(
+        id="wifi-rssi",
+        owner="30a2df8c-109b-42c2-aed6-a6b30c565f8f",
+        _value=-50,
+        instance=None,
+        unit="dB",
+    )
+}
+FREEZER_EXPECTED_SENSORS = {
+    "wifi-rssi": HubspaceSensor(
+        id="wifi-rssi",
+        owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
+        _value=-71,
+        instance=None,
+        unit="dB",
+    )
+}
+FREEZER_EXPECTED_BINARY_SENSORS = {
+    "error|freezer-high-temperature-alert": HubspaceSensorError(
+        id="error|freezer-high-temperature-alert",
+        owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
+        _value="normal",
+        instance="freezer-high-temperature-alert",
+    ),
+    "error|fridge-high-temperature-alert": HubspaceSensorError(
+        id="error|fridge-high-temperature-alert",
+        owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
+        _value="alerting",
+        instance="fridge-high-temperature-alert",
+    ),
+    "error|mcu-communication-failure": HubspaceSensorError(
+        id="error|mcu-communication-failure",
+        owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
+        _value="normal",
+        instance="mcu-communication-failure",
+    ),
+    "error|temperature-sensor-failure": HubspaceSensorError(
+        id="error|temperature-sensor-failure",
+        owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
+        _value="normal",
+        instance="temperature-sensor-failure",
+    ),
+}
+
 
 @pytest.fixture
-def mocked_controller(mocked_bridge, mocker):
-    mocker.patch("time.time", return_value=12345)
+def mocked_controller(mocked_bridge, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 12345)
     controller = DeviceController(mocked_bridge)
     yield controller
 
 
 @pytest.mark.asyncio
-async def test_initialize_a21(mocked_controller):
-    await mocked_controller.initialize_elem(a21_light)
-    assert len(mocked_controller.items) == 1
-    dev = mocked_controller.items[0]
-    assert dev.id == a21_light.id
-    assert dev.available is True
-    assert dev.device_information == DeviceInformation(
-        device_class=a21_light.device_class,
-        default_image=a21_light.default_image,
-        default_name=a21_light.default_name,
-        manufacturer=a21_light.manufacturerName,
-        model=a21_light.model,
-        name=a21_light.friendly_name,
-        parent_id=a21_light.device_id,
-        wifi_mac="b31d2f3f-86f6-4e7e-b91b-4fbc161d410d",
-        ble_mac="9c70c759-1d54-4f61-a067-bb4294bef7ae",
-    )
-    assert dev.sensors == {
-        "wifi-rssi": HubspaceSensor(
-            id="wifi-rssi",
-            owner="30a2df8c-109b-42c2-aed6-a6b30c565f8f",
-            _value=-50,
-            instance=None,
-            unit="dB",
-        )
-    }
-    assert dev.binary_sensors == {}
-
-
-@pytest.mark.asyncio
-async def test_initialize_binary_sensors(mocked_controller):
-    await mocked_controller.initialize_elem(freezer)
+@pytest.mark.parametrize(
+    "device, expected_wifi, expected_ble, expected_sensors, expected_binary",
+    [
+        (
+            a21_light,
+            "b31d2f3f-86f6-4e7e-b91b-4fbc161d410d",
+            "9c70c759-1d54-4f61-a067-bb4294bef7ae",
+            A21_EXPECTED_SENSORS,
+            {},
+        ),
+        (
+            freezer,
+            "351cccd0-87ff-41b3-b18c-568cf781d56d",
+            "c2e189e8-c80c-4948-9492-14ac390f480d",
+            FREEZER_EXPECTED_SENSORS,
+            FREEZER_EXPECTED_BINARY_SENSORS,
+        ),
+    ],
+)
+async def test_initialize(
+    device,
+    expected_wifi,
+    expected_ble,
+    expected_sensors,
+    expected_binary,
+    mocked_controller,
+):
+    await mocked_controller.initialize_elem(device)
     assert len(mocked_controller.items) == 1
     dev = mocked_controller.items[0]
-    assert dev.id == freezer.id
+    assert dev.id == device.id
     assert dev.available is True
     assert dev.device_information == DeviceInformation(
-        device_class=freezer.device_class,
-        default_image=freezer.default_image,
-        default_name=freezer.default_name,
-        manufacturer=freezer.manufacturerName,
-        model=freezer.model,
-        name=freezer.friendly_name,
-        parent_id=freezer.device_id,
-        wifi_mac="351cccd0-87ff-41b3-b18c-568cf781d56d",
-        ble_mac="c2e189e8-c80c-4948-9492-14ac390f480d",
+        device_class=device.device_class,
+        default_image=device.default_image,
+        default_name=device.default_name,
+        manufacturer=device.manufacturerName,
+        model=device.model,
+        name=device.friendly_name,
+        parent_id=device.device_id,
+        wifi_mac=expected_wifi,
+        ble_mac=expected_ble,
     )
-    assert dev.sensors == {
-        "wifi-rssi": HubspaceSensor(
-            id="wifi-rssi",
-            owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
-            _value=-71,
-            instance=None,
-            unit="dB",
-        )
-    }
-    assert dev.binary_sensors == {
-        "error|freezer-high-temperature-alert": HubspaceSensorError(
-            id="error|freezer-high-temperature-alert",
-            owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
-            _value="normal",
-            instance="freezer-high-temperature-alert",
-        ),
-        "error|fridge-high-temperature-alert": HubspaceSensorError(
-            id="error|fridge-high-temperature-alert",
-            owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
-            _value="alerting",
-            instance="fridge-high-temperature-alert",
-        ),
-        "error|mcu-communication-failure": HubspaceSensorError(
-            id="error|mcu-communication-failure",
-            owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
-            _value="normal",
-            instance="mcu-communication-failure",
-        ),
-        "error|temperature-sensor-failure": HubspaceSensorError(
-            id="error|temperature-sensor-failure",
-            owner="596c120d-4e0d-4e33-ae9a-6330dcf2cbb5",
-            _value="normal",
-            instance="temperature-sensor-failure",
-        ),
-    }
+    assert dev.sensors == expected_sensors
+    assert dev.binary_sensors == expected_binary
 
 
 @pytest.mark.parametrize(
-    "filename, expected",
+    "data_fixture, expected",
     [
         (
-            "raw_hs_data.json",
+            "raw_hs_data",
             [
                 "80c0d48afc5cea1a",
                 "8ea6c4d8d54e8c6a",
@@ -120,21 +129,22 @@ async def test_initialize_binary_sensors(mocked_controller):
             ],
         ),
         (
-            "water-timer-raw.json",
+            "water_timer_raw",
             [
                 "86114564-7acd-4542-9be9-8fd798a22b06",
             ],
         ),
     ],
 )
-def test_get_filtered_devices(filename, expected, mocked_controller, caplog):
+def test_get_filtered_devices(
+    data_fixture, expected, mocked_controller, caplog, request
+):
     caplog.set_level(0)
-    data = utils.get_raw_dump(filename)
+    data = request.getfixturevalue(data_fixture)
     res = mocked_controller.get_filtered_devices(data)
-    actual_devs = [x.device_id for x in res]
-    assert len(actual_devs) == len(expected)
-    for key in expected:
-        assert key in actual_devs
+    actual_ids = {x.device_id for x in res}
+    assert len(res) == len(expected)
+    assert actual_ids == set(expected)
 
 
 @pytest.mark.asyncio
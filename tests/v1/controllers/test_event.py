@@ -7,6 +7,8 @@ import pytest
 from aiohttp.web_exceptions import HTTPForbidden, HTTPTooManyRequests
 
 from aiohubspace import InvalidAuth
+from aiohubspace.device import HubspaceState
+from aiohubspace.v1 import HubspaceBridgeV1
 from aiohubspace.v1.controllers import event
 from aiohubspace.v1.models.resource import ResourceTypes
 
@@ -14,6 +16,60 @@ from .. import utils
 
 a21_light = utils.create_devices_from_data("light-a21.json")[0]
 switch = utils.create_devices_from_data("switch-HPDA311CWB.json")[0]
+raw_a21_light = utils.to_raw_device(a21_light)
+raw_switch = utils.to_raw_device(switch)
+
+A21_ADDED_EVENT = {
+    "type": event.EventType.RESOURCE_ADDED,
+    "device_id": a21_light.id,
+    "device": a21_light,
+    "force_forward": False,
+}
+A21_UPDATED_EVENT = {
+    "type": event.EventType.RESOURCE_UPDATED,
+    "device_id": a21_light.id,
+    "device": a21_light,
+    "force_forward": False,
+}
+SWITCH_UPDATED_EVENT = {
+    "type": event.EventType.RESOURCE_UPDATED,
+    "device_id": switch.id,
+    "device": switch,
+    "force_forward": False,
+}
+# Known device that is missing from the poll
+MISSING_DELETED_EVENT = {
+    "type": event.EventType.RESOURCE_DELETED,
+    "device_id": "doesnt_exist_list",
+}
+
+
+async def wait_for_event(queue: asyncio.Queue, timeout: float = 1.0):
+    """Wait for the next item to be placed onto the queue
+
+    :param queue: Queue to read from
+    :param timeout: Seconds to wait before raising TimeoutError
+    """
+    return await asyncio.wait_for(queue.get(), timeout=timeout)
+
+
+@pytest.fixture
+def unfiltered_states(mocker):
+    """Parse every state so polled devices match the device dumps"""
+    return mocker.patch.object(
+        HubspaceBridgeV1,
+        "function_classes",
+        new_callable=mocker.PropertyMock,
+        return_value=None,
+    )
+
+
+def drain_queue(queue: asyncio.Queue) -> list:
+    """Pull everything currently on the queue without waiting
+
+    :param queue: Queue to drain
+    """
+    return [queue.get_nowait() for _ in range(queue.qsize())]
 
 
 @pytest.mark.asyncio
@@ -43,63 +99,60 @@ async def test_stop(bridge):
     assert len(stream._bg_tasks) == 0
 
 
+_SUBSCRIBE_CASES = [
+    (min, None, None, {event.EVENT_FILTER_ALL: [(0, min, None, False)]}),
+    (
+        min,
+        event.EventType.RESOURCE_UPDATED,
+        max,
+        {
+            event.EVENT_FILTER_ALL: [],
+            event.EventType.RESOURCE_UPDATED: [(0, min, frozenset({max}), False)],
+        },
+    ),
+    (
+        min,
+        (event.EventType.RESOURCE_UPDATED, event.EventType.RESOURCE_DELETED),
+        max,
+        {
+            event.EVENT_FILTER_ALL: [],
+            event.EventType.RESOURCE_UPDATED: [(0, min, frozenset({max}), False)],
+            event.EventType.RESOURCE_DELETED: [(0, min, frozenset({max}), False)],
+        },
+    ),
+    # Repeated event types only register once
+    (
+        min,
+        (event.EventType.RESOURCE_UPDATED, event.EventType.RESOURCE_UPDATED),
+        None,
+        {
+            event.EVENT_FILTER_ALL: [],
+            event.EventType.RESOURCE_UPDATED: [(0, min, None, False)],
+        },
+    ),
+]
+
+
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "call,event_filter,resource_filter,expected",
-    [
-        (min, None, None, (min, None, None)),
-        (
-            min,
-            event.EventType.RESOURCE_UPDATED,
-            max,
-            (min, (event.EventType.RESOURCE_UPDATED,), (max,)),
-        ),
-        (
-            min,
-            (event.EventType.RESOURCE_UPDATED, event.EventType.RESOURCE_DELETED),
-            max,
-            (
-                min,
-                (event.EventType.RESOURCE_UPDATED, event.EventType.RESOURCE_DELETED),
-                (max,),
-            ),
-        ),
-    ],
-)
+@pytest.mark.parametrize("call,event_filter,resource_filter,expected", _SUBSCRIBE_CASES)
 async def test_subscribe(call, event_filter, resource_filter, expected, mocked_bridge):
     events = mocked_bridge.events
     unsub = events.subscribe(call, event_filter, resource_filter)
     assert callable(unsub)
-    assert len(events._subscribers) == 1
-    assert events._subscribers[0] == expected
+    assert events._subscribers == expected
     unsub()
-    assert len(events._subscribers) == 0
+    assert all(not subs for subs in events._subscribers.values())
 
 
 @pytest.mark.asyncio
-async def test_event_reader_dev_add(bridge, mocker):
+async def test_event_reader_dev_add(bridge, mocker, unfiltered_states):
     stream = bridge.events
-    stream._subscribers = []
+    stream._subscribers = {event.EVENT_FILTER_ALL: []}
     await stream.stop()
 
-    def hs_dev(dev):
-        return dev
-
-    mocker.patch.object(bridge, "fetch_data", AsyncMock(return_value=[a21_light]))
-    mocker.patch.object(event, "get_hs_device", side_effect=hs_dev)
+    mocker.patch.object(bridge, "fetch_data", AsyncMock(return_value=[raw_a21_light]))
     await stream.initialize_reader()
-    max_retry = 10
-    retry = 0
-    while True:
-        if retry >= max_retry:
-            raise AssertionError("Item never added")
-        if stream._event_queue.qsize() == 0:
-            retry += 1
-            await asyncio.sleep(0.1)
-        else:
-            break
-    assert stream._event_queue.qsize() != 0
-    event_to_process = await stream._event_queue.get()
+    event_to_process = await wait_for_event(stream._event_queue)
     assert event_to_process == {
         "type": event.EventType.RESOURCE_ADDED,
         "device_id": a21_light.id,
@@ -253,36 +306,104 @@ async def test_gather_data(
 
 
 @pytest.mark.asyncio
-async def test_generate_events_from_data(bridge, mocker):
+async def test_generate_events_from_data(bridge, unfiltered_states):
     stream = bridge.events
     await stream.stop()
-    a21_light = utils.create_devices_from_data("light-a21.json")[0]
-    switch = utils.create_devices_from_data("switch-HPDA311CWB.json")[0]
     bridge._known_devs = {
         switch.id: bridge.switches,
         "doesnt_exist_list": bridge.lights,
     }
-    bad_switch = dataclasses.replace(switch)
-    bad_switch.device_class = ""
-    mocker.patch.object(event, "get_hs_device", side_effect=lambda x: x)
-    await stream.generate_events_from_data([a21_light, switch, bad_switch])
-    assert stream._event_queue.qsize() == 3
-    assert await stream._event_queue.get() == {
-        "type": event.EventType.RESOURCE_ADDED,
-        "device_id": a21_light.id,
-        "device": a21_light,
-        "force_forward": False,
-    }
-    assert await stream._event_queue.get() == {
+    bad_switch = utils.to_raw_device(dataclasses.replace(switch, device_class=""))
+    await stream.generate_events_from_data([raw_a21_light, raw_switch, bad_switch])
+    assert drain_queue(stream._event_queue) == [
+        A21_ADDED_EVENT,
+        SWITCH_UPDATED_EVENT,
+        MISSING_DELETED_EVENT,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_generate_events_from_data_unchanged(bridge, unfiltered_states):
+    stream = bridge.events
+    await stream.stop()
+    bridge._known_devs = {switch.id: bridge.switches}
+    timed_switch = dataclasses.replace(
+        switch,
+        states=[
+            dataclasses.replace(state, lastUpdateTime=1000) for state in switch.states
+        ],
+    )
+    raw_timed_switch = utils.to_raw_device(timed_switch)
+    await stream.generate_events_from_data([raw_timed_switch])
+    assert stream._event_queue.qsize() == 1
+    stream._event_queue.get_nowait()
+    # Nothing changed so nothing should be emitted
+    await stream.generate_events_from_data([raw_timed_switch])
+    assert stream._event_queue.qsize() == 0
+    assert switch.id in bridge.tracked_devices
+    # A local change means the next poll must be emitted
+    stream.reset_last_update(switch.id)
+    await stream.generate_events_from_data([raw_timed_switch])
+    assert stream._event_queue.qsize() == 1
+    stream._event_queue.get_nowait()
+    # A newer state should be emitted
+    updated_switch = dataclasses.replace(
+        timed_switch,
+        states=[dataclasses.replace(switch.states[0], lastUpdateTime=9999999999999)],
+    )
+    await stream.generate_events_from_data([utils.to_raw_device(updated_switch)])
+    assert stream._event_queue.get_nowait() == {
         "type": event.EventType.RESOURCE_UPDATED,
         "device_id": switch.id,
-        "device": switch,
+        "device": updated_switch,
         "force_forward": False,
     }
-    assert await stream._event_queue.get() == {
-        "type": event.EventType.RESOURCE_DELETED,
-        "device_id": "doesnt_exist_list",
-    }
+
+
+@pytest.mark.asyncio
+async def test_generate_events_from_data_no_timestamps(bridge):
+    stream = bridge.events
+    await stream.stop()
+    raw_timer = utils.get_raw_dump("water-timer-raw.json")[0]
+    await stream.generate_events_from_data([raw_timer])
+    assert stream._event_queue.get_nowait()["type"] == event.EventType.RESOURCE_ADDED
+    bridge.add_device(raw_timer["id"], bridge.valves)
+    for state in raw_timer["state"]["values"]:
+        if state["functionClass"] == "toggle":
+            state["value"] = "on" if state["value"] == "off" else "off"
+    # Nothing reports a lastUpdateTime so changes must still be emitted
+    await stream.generate_events_from_data([raw_timer])
+    updated = stream._event_queue.get_nowait()
+    assert updated["type"] == event.EventType.RESOURCE_UPDATED
+    assert updated["device_id"] == raw_timer["id"]
+
+
+@pytest.mark.asyncio
+async def test_generate_events_from_data_function_classes(bridge, mocker):
+    stream = bridge.events
+    parse = mocker.spy(event, "get_hs_device")
+    await stream.stop()
+    raw_lock = utils.get_raw_dump("device_lock.json")[0]
+    all_classes = {state["functionClass"] for state in raw_lock["state"]["values"]}
+    assert not all_classes <= bridge.function_classes
+    # New devices keep every state for initialization and subscribers
+    await stream.generate_events_from_data([raw_lock])
+    added = stream._event_queue.get_nowait()
+    assert added["type"] == event.EventType.RESOURCE_ADDED
+    parse.assert_called_once_with(raw_lock)
+    assert {state.functionClass for state in added["device"].states} == all_classes
+    # Updates only carry the states controllers read
+    bridge.add_device(raw_lock["id"], bridge.locks)
+    for state in raw_lock["state"]["values"]:
+        if state["functionClass"] == "lock-control":
+            state["lastUpdateTime"] = 9999999999999
+    await stream.generate_events_from_data([raw_lock])
+    updated = stream._event_queue.get_nowait()
+    assert updated["type"] == event.EventType.RESOURCE_UPDATED
+    assert parse.call_count == 2
+    assert {state.functionClass for state in updated["device"].states} == (
+        all_classes & bridge.function_classes
+    )
 
 
 @pytest.mark.asyncio
@@ -294,34 +415,18 @@ async def test_generate_events_from_data(bridge, mocker):
     [
         # Happy path
         (
-            [a21_light, switch],
+            [raw_a21_light, raw_switch],
             None,
             [],
             [],
-            [
-                {
-                    "type": event.EventType.RESOURCE_ADDED,
-                    "device_id": a21_light.id,
-                    "device": a21_light,
-                    "force_forward": False,
-                },
-                {
-                    "type": event.EventType.RESOURCE_UPDATED,
-                    "device_id": switch.id,
-                    "device": switch,
-                    "force_forward": False,
-                },
-                {
-                    "type": event.EventType.RESOURCE_DELETED,
-                    "device_id": "doesnt_exist_list",
-                },
-            ],
+            [A21_ADDED_EVENT, SWITCH_UPDATED_EVENT, MISSING_DELETED_EVENT],
         ),
         # Issue collecting data
         (None, KeyError, None, [event.EventType.DISCONNECTED], []),
         # Issue processing collected data
         (None, None, KeyError, [], []),
     ],
+    ids=["happy", "gather-error", "generate-error"],
 )
 async def test_perform_poll(
     gather_data_return,
@@ -331,6 +436,7 @@ async def test_perform_poll(
     expected_queue,
     bridge,
     mocker,
+    unfiltered_states,
 ):
     stream = bridge.events
     await stream.stop()
@@ -352,42 +458,25 @@ async def test_perform_poll(
         "doesnt_exist_list": bridge.lights,
     }
     emit_calls = mocker.patch.object(stream, "emit")
-    mocker.patch.object(event, "get_hs_device", side_effect=lambda x: x)
 
     await stream.perform_poll()
     assert emit_calls.call_count == len(expected_emits)
     for index, emit in enumerate(expected_emits):
         assert emit_calls.call_args_list[index][0][0] == emit, f"Issue at index {index}"
-    assert stream._event_queue.qsize() == len(expected_queue)
-    for index, event_to_process in enumerate(expected_queue):
-        assert (
-            await stream._event_queue.get() == event_to_process
-        ), f"Issue at index {index}"
+    assert drain_queue(stream._event_queue) == expected_queue
 
 
 @pytest.mark.asyncio
-async def test_event_reader_dev_update(bridge, mocker):
+async def test_event_reader_dev_update(bridge, mocker, unfiltered_states):
     stream = bridge.events
     bridge.lights.initialize({})
     await bridge.lights.initialize_elem(a21_light)
     bridge.add_device(a21_light.id, bridge.lights)
     await stream.stop()
 
-    mocker.patch.object(stream, "gather_data", AsyncMock(return_value=[a21_light]))
-    mocker.patch.object(event, "get_hs_device", side_effect=lambda x: x)
+    mocker.patch.object(stream, "gather_data", AsyncMock(return_value=[raw_a21_light]))
     await stream.initialize_reader()
-    max_retry = 10
-    retry = 0
-    while True:
-        if retry >= max_retry:
-            raise AssertionError("Item never added")
-        if stream._event_queue.qsize() == 0:
-            retry += 1
-            await asyncio.sleep(0.1)
-        else:
-            break
-    assert stream._event_queue.qsize() != 0
-    event_to_process = await stream._event_queue.get()
+    event_to_process = await wait_for_event(stream._event_queue)
     assert event_to_process == {
         "type": event.EventType.RESOURCE_UPDATED,
         "device_id": a21_light.id,
@@ -400,28 +489,13 @@ async def test_event_reader_dev_update(bridge, mocker):
 async def test_event_reader_dev_delete(bridge, mocker):
     stream = bridge.events
     bridge.lights.initialize({})
-    bridge.lights.initialize_elem(a21_light)
+    await bridge.lights.initialize_elem(a21_light)
     bridge.add_device(a21_light.id, bridge.lights)
     await stream.stop()
 
-    def hs_dev(dev):
-        return dev
-
     mocker.patch.object(bridge, "fetch_data", AsyncMock(return_value=[]))
-    mocker.patch.object(event, "get_hs_device", side_effect=hs_dev)
     await stream.initialize_reader()
-    max_retry = 10
-    retry = 0
-    while True:
-        if retry >= max_retry:
-            raise AssertionError("Item never added")
-        if stream._event_queue.qsize() == 0:
-            retry += 1
-            await asyncio.sleep(0.1)
-        else:
-            break
-    assert stream._event_queue.qsize() != 0
-    event_to_process = await stream._event_queue.get()
+    event_to_process = await wait_for_event(stream._event_queue)
     assert event_to_process == {
         "type": event.EventType.RESOURCE_DELETED,
         "device_id": a21_light.id,
@@ -429,33 +503,11 @@ async def test_event_reader_dev_delete(bridge, mocker):
 
 
 @pytest.mark.asyncio
-@pytest.mark.parametrize(
-    "pop_event,has_exception",
-    [
-        (
-            {
-                "type": event.EventType.RESOURCE_UPDATED,
-                "device_id": a21_light.id,
-                "device": a21_light,
-                "force_forward": False,
-            },
-            False,
-        ),
-        (
-            {
-                "type": event.EventType.RESOURCE_UPDATED,
-                "device_id": a21_light.id,
-                "device": a21_light,
-                "force_forward": False,
-            },
-            True,
-        ),
-    ],
-)
-async def test_process_event(pop_event, has_exception, bridge, mocker, caplog):
+@pytest.mark.parametrize("has_exception", [False, True])
+async def test_process_event(has_exception, bridge, mocker, caplog):
     stream = bridge.events
     await stream.stop()
-    await stream._event_queue.put(pop_event)
+    await stream._event_queue.put(A21_UPDATED_EVENT)
     if not has_exception:
         emit_calls = mocker.patch.object(stream, "emit")
         await stream.process_event()
@@ -466,25 +518,57 @@ async def test_process_event(pop_event, has_exception, bridge, mocker, caplog):
         assert "Unhandled exception. Please open a bug report" in caplog.text
 
 
+@pytest.mark.parametrize(
+    "states,expected",
+    [
+        ([], None),
+        ([HubspaceState(functionClass="power", value="on")], None),
+        ([HubspaceState(functionClass="power", value="on", lastUpdateTime=0)], None),
+        (
+            [
+                HubspaceState(functionClass="power", value="on", lastUpdateTime=5),
+                HubspaceState(functionClass="available", value=True),
+                HubspaceState(functionClass="toggle", value="on", lastUpdateTime=12),
+            ],
+            12,
+        ),
+    ],
+)
+def test_latest_update_time(states, expected):
+    assert event.latest_update_time(states) == expected
+
+
+@pytest.mark.asyncio
+async def test_process_event_batch(bridge, mocker):
+    stream = bridge.events
+    await stream.stop()
+    events = [
+        event.HubspaceEvent(type=event.EventType.RESOURCE_DELETED, device_id=dev_id)
+        for dev_id in ["1234", "5678", "9012"]
+    ]
+    for hs_event in events:
+        stream._event_queue.put_nowait(hs_event)
+    emit_calls = mocker.patch.object(stream, "emit", side_effect=[KeyError, None, None])
+    await stream.process_event()
+    assert stream._event_queue.qsize() == 0
+    assert emit_calls.call_args_list == [
+        mocker.call(hs_event["type"], hs_event) for hs_event in events
+    ]
+
+
 @pytest.mark.asyncio
 async def test___event_processor(bridge, mocker):
     stream = bridge.events
-    emit = mocker.patch.object(stream, "emit")
+    processed = asyncio.Event()
+    emit = mocker.patch.object(
+        stream, "emit", side_effect=lambda *args: processed.set()
+    )
     exp_event = event.HubspaceEvent(
         type=event.EventType.RESOURCE_DELETED, device_id="1234"
     )
     stream._event_queue.put_nowait(exp_event)
     await stream.initialize_processor()
-    max_retry = 10
-    retry = 0
-    while True:
-        if retry >= max_retry:
-            raise AssertionError("Item never removed")
-        if stream._event_queue.qsize() == 1:
-            retry += 1
-            await asyncio.sleep(0.1)
-        else:
-            break
+    await asyncio.wait_for(processed.wait(), timeout=1.0)
     assert stream._event_queue.qsize() == 0
     emit.assert_called_once_with(exp_event["type"], exp_event)
 
@@ -497,12 +581,13 @@ async def test___event_processor(bridge, mocker):
         (event.EventType.RESOURCE_ADDED, (event.EventType.RESOURCE_ADDED,), True),
         (event.EventType.RESOURCE_UPDATED, (event.EventType.RESOURCE_ADDED,), False),
     ],
+    ids=["added-match", "updated-nomatch"],
 )
 async def test_emit_event_type(
     event_type, event_filter, expected, is_coroutine, bridge, mocker
 ):
     stream = bridge.events
-    stream._subscribers = []
+    stream._subscribers = {event.EVENT_FILTER_ALL: []}
     await stream.stop()
 
     event_to_emit = event.HubspaceEvent(
@@ -518,10 +603,29 @@ async def test_emit_event_type(
         callback.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_emit_subscription_order(bridge, mocker):
+    stream = bridge.events
+    stream._subscribers = {event.EVENT_FILTER_ALL: []}
+    await stream.stop()
+    calls = []
+    stream.subscribe(lambda *_: calls.append("all-first"))
+    stream.subscribe(
+        lambda *_: calls.append("updated"),
+        event_filter=(
+            event.EventType.RESOURCE_UPDATED,
+            event.EventType.RESOURCE_UPDATED,
+        ),
+    )
+    stream.subscribe(lambda *_: calls.append("all-last"))
+    stream.emit(event.EventType.RESOURCE_UPDATED, A21_UPDATED_EVENT)
+    assert calls == ["all-first", "updated", "all-last"]
+
+
 @pytest.mark.asyncio
 async def test_emit_invalid_auth(bridge, mocker):
     stream = bridge.events
-    stream._subscribers = []
+    stream._subscribers = {event.EVENT_FILTER_ALL: []}
     await stream.stop()
     callback = mocker.AsyncMock()
     event_type = event.EventType.INVALID_AUTH
@@ -547,6 +651,7 @@ async def test_emit_invalid_auth(bridge, mocker):
             True,
         ),
     ],
+    ids=["a21-light-match", "a21-fan-nomatch", "switch-match"],
 )
 async def test_emit_resource_filter(
     device, resource_filter, expected, is_coroutine, bridge, mocker
@@ -576,6 +681,15 @@ async def test_emit_resource_filter_exception(bridge, caplog):
         device_id="cool_id",
         device="im not a hubspace device",
     )
-    stream.subscribe(min, resource_filter=(ResourceTypes.LIGHT.value,))
+    records = []
+    stream.subscribe(
+        lambda *args: records.append(args),
+        resource_filter=(ResourceTypes.LIGHT.value,),
+    )
     stream.emit(event.EventType.RESOURCE_UPDATED, event_to_emit)
-    assert "Unhandled exception. Please open a bug report" in caplog.text
+    assert records == []
+    assert any(
+        record.levelno == logging.ERROR
+        and record.getMessage() == "Unhandled exception. Please open a bug report"
+        for record in caplog.records
+    )
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import time
 
 import pytest
 
@@ -15,8 +16,8 @@ zandra_fan = utils.create_devices_from_data("fan-ZandraFan.json")[0]
 
 
 @pytest.fixture
-def mocked_controller(mocked_bridge, mocker):
-    mocker.patch("time.time", return_value=12345)
+def mocked_controller(mocked_bridge, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 12345)
     controller = FanController(mocked_bridge)
     yield controller
 
@@ -255,8 +256,7 @@ async def test_update_elem(mocked_controller):
             }
         ),
     ]
-    for state in new_states:
-        utils.modify_state(dev_update, state)
+    utils.modify_states(dev_update, new_states)
     updates = await mocked_controller.update_elem(dev_update)
     dev = mocked_controller.items[0]
     assert dev.preset.enabled is False
@@ -275,6 +275,25 @@ async def test_update_elem_no_updates(mocked_controller):
     assert updates == set()
 
 
+@pytest.mark.asyncio
+async def test_update_elem_states_unchanged(mocked_controller):
+    await mocked_controller.initialize_elem(zandra_fan)
+    dev_update = utils.create_devices_from_data("fan-ZandraFan.json")[0]
+    utils.modify_state(
+        dev_update,
+        HubspaceState(
+            functionClass="power",
+            functionInstance="fan-power",
+            value="off",
+            lastUpdateTime=0,
+        ),
+    )
+    assert await mocked_controller.update_elem(dev_update) == {"on"}
+    mocked_controller.items[0].on.on = True
+    assert await mocked_controller.update_elem(dev_update) == set()
+    assert mocked_controller.items[0].on.on is True
+
+
 # @TODO - Create tests for BaseResourcesController
 @pytest.mark.asyncio
 async def test_update(mocked_controller):
@@ -1,11 +1,12 @@
 """Test LightController"""
 
 import asyncio
+import time
 
 import pytest
 
 from aiohubspace.device import HubspaceState
-from aiohubspace.v1.controllers import event
+from aiohubspace.v1.controllers import event, light
 from aiohubspace.v1.controllers.light import (
     LightController,
     features,
@@ -22,12 +23,19 @@ dimmer_light = utils.create_devices_from_data("dimmer-HPDA1110NWBP.json")[0]
 
 
 @pytest.fixture
-def mocked_controller(mocked_bridge, mocker):
-    mocker.patch("time.time", return_value=12345)
+def mocked_controller(mocked_bridge, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 12345)
     controller = LightController(mocked_bridge)
     yield controller
 
 
+@pytest.mark.asyncio
+async def test_initialize_effects_processed_once(mocked_controller, mocker):
+    process_effects = mocker.spy(light, "process_effects")
+    await mocked_controller.initialize_elem(a21_light)
+    process_effects.assert_called_once_with(a21_light.functions)
+
+
 @pytest.mark.asyncio
 async def test_initialize_a21(mocked_controller):
     await mocked_controller.initialize_elem(a21_light)
@@ -525,8 +533,7 @@ async def test_update_elem(mocked_controller):
             }
         ),
     ]
-    for state in new_states:
-        utils.modify_state(dev_update, state)
+    utils.modify_states(dev_update, new_states)
     updates = await mocked_controller.update_elem(dev_update)
     dev = mocked_controller.items[0]
     assert dev.on.on is True
@@ -604,8 +611,7 @@ async def test_update_elem_effect(new_states, expected, mocked_controller):
     await mocked_controller.initialize_elem(a21_light)
     assert len(mocked_controller.items) == 1
     dev_update = utils.create_devices_from_data("light-a21.json")[0]
-    for state in new_states:
-        utils.modify_state(dev_update, state)
+    utils.modify_states(dev_update, new_states)
     await mocked_controller.update_elem(dev_update)
     dev = mocked_controller.items[0]
     assert dev.effect.effect == expected
@@ -699,6 +705,17 @@ seq_preset = {
     ),
 }
 
+seq_missing = {
+    "preset": HubspaceState(
+        **{
+            "functionClass": "color-sequence",
+            "value": "custom",
+            "lastUpdateTime": 0,
+            "functionInstance": "preset",
+        }
+    ),
+}
+
 light1_effects = {
     "preset": {"fade-3"},
     "custom": {"rainbow"},
@@ -732,6 +749,7 @@ light1_no_update_preset = Light(
         (light1_no_update, seq_custom, "rainbow", False),
         (light1, seq_preset, "fade-3", True),
         (light1_no_update_preset, seq_preset, "fade-3", False),
+        (light1_no_update, seq_missing, "rainbow", False),
     ],
 )
 async def test_update_elem_color(
@@ -742,6 +760,14 @@ async def test_update_elem_color(
     assert elem.effect.effect == expected_effect
 
 
+@pytest.mark.parametrize(
+    "value, expected",
+    [("2700K", 2700), ("3000", 3000), (4000, 4000)],
+)
+def test__parse_temp(value, expected):
+    assert light._parse_temp(value) == expected
+
+
 def test_process_color_temps():
     temps = [{"name": "2700K"}, {"name": "3000"}]
     assert process_color_temps(temps) == [2700, 3000]
@@ -1,6 +1,7 @@
 """Test LockController"""
 
 import asyncio
+import time
 
 import pytest
 
@@ -14,8 +15,8 @@ lock = utils.create_devices_from_data("door-lock-TBD.json")[0]
 
 
 @pytest.fixture
-def mocked_controller(mocked_bridge, mocker):
-    mocker.patch("time.time", return_value=12345)
+def mocked_controller(mocked_bridge, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 12345)
     controller = LockController(mocked_bridge)
     yield controller
 
@@ -110,8 +111,7 @@ async def test_update_elem(value, expected, expected_updates, mocked_controller)
         ),
     ]
     expected_updates.add("available")
-    for state in new_states:
-        utils.modify_state(dev_update, state)
+    utils.modify_states(dev_update, new_states)
     updates = await mocked_controller.update_elem(dev_update)
     assert dev.position.position == expected
     assert not dev.available
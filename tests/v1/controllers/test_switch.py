@@ -1,6 +1,7 @@
 """Test SwitchController"""
 
 import asyncio
+import time
 
 import pytest
 
@@ -16,8 +17,8 @@ glass_door = utils.create_devices_from_data("glass-door.json")[0]
 
 
 @pytest.fixture
-def mocked_controller(mocked_bridge, mocker):
-    mocker.patch("time.time", return_value=12345)
+def mocked_controller(mocked_bridge, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 12345)
     controller = SwitchController(mocked_bridge)
     yield controller
 
@@ -239,8 +240,7 @@ async def test_update_elem(mocked_controller):
             }
         ),
     ]
-    for state in new_states:
-        utils.modify_state(dev_update, state)
+    utils.modify_states(dev_update, new_states)
     updates = await mocked_controller.update_elem(dev_update)
     dev = mocked_controller.items[0]
     assert dev.on["zone-1"].on is True
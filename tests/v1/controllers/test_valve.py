@@ -1,6 +1,7 @@
 """Test ValveController"""
 
 import asyncio
+import time
 
 import pytest
 
@@ -10,131 +11,127 @@ from aiohubspace.v1.controllers.valve import ValveController, features
 
 from .. import utils
 
+pytestmark = pytest.mark.asyncio
+
 valve = utils.create_devices_from_data("water-timer.json")[0]
 
+EXPECTED_OPEN_INITIAL = {
+    None: features.OpenFeature(open=False, func_class="power", func_instance=None),
+    "spigot-1": features.OpenFeature(
+        open=False, func_class="toggle", func_instance="spigot-1"
+    ),
+    "spigot-2": features.OpenFeature(
+        open=True, func_class="toggle", func_instance="spigot-2"
+    ),
+}
+EXPECTED_OPEN_AFTER_ON = {
+    None: features.OpenFeature(open=False, func_class="power", func_instance=None),
+    "spigot-1": features.OpenFeature(
+        open=True, func_class="toggle", func_instance="spigot-1"
+    ),
+    "spigot-2": features.OpenFeature(
+        open=True, func_class="toggle", func_instance="spigot-2"
+    ),
+}
+EXPECTED_OPEN_AFTER_OFF = {
+    None: features.OpenFeature(open=False, func_class="power", func_instance=None),
+    "spigot-1": features.OpenFeature(
+        open=False, func_class="toggle", func_instance="spigot-1"
+    ),
+    "spigot-2": features.OpenFeature(
+        open=False, func_class="toggle", func_instance="spigot-2"
+    ),
+}
+
+# States pushed by test_update_elem; never modified
+UPDATE_STATES = (
+    HubspaceState(
+        **{
+            "functionClass": "toggle",
+            "value": "on",
+            "lastUpdateTime": 0,
+            "functionInstance": "spigot-1",
+        }
+    ),
+    HubspaceState(
+        **{
+            "functionClass": "toggle",
+            "value": "off",
+            "lastUpdateTime": 0,
+            "functionInstance": "spigot-2",
+        }
+    ),
+    HubspaceState(
+        **{
+            "functionClass": "available",
+            "value": False,
+            "lastUpdateTime": 0,
+            "functionInstance": None,
+        }
+    ),
+)
+
 
 @pytest.fixture
-def mocked_controller(mocked_bridge, mocker):
-    mocker.patch("time.time", return_value=12345)
+def mocked_controller(mocked_bridge, monkeypatch):
+    monkeypatch.setattr(time, "time", lambda: 12345)
     controller = ValveController(mocked_bridge)
     yield controller
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def valve_device():
+    """Fresh water timer that tests are free to modify"""
+    return utils.create_devices_from_data("water-timer.json")[0]
+
+
 async def test_initialize_multi(mocked_controller):
     await mocked_controller.initialize_elem(valve)
     assert len(mocked_controller.items) == 1
     dev = mocked_controller.items[0]
     assert dev.id == "60eb18c9-8510-4bcd-be3f-493dfb351268"
-    assert dev.open == {
-        None: features.OpenFeature(open=False, func_class="power", func_instance=None),
-        "spigot-1": features.OpenFeature(
-            open=False, func_class="toggle", func_instance="spigot-1"
-        ),
-        "spigot-2": features.OpenFeature(
-            open=True, func_class="toggle", func_instance="spigot-2"
-        ),
-    }
+    assert dev.open == EXPECTED_OPEN_INITIAL
 
 
-@pytest.mark.asyncio
-async def test_turn_on_multi(mocked_controller):
+@pytest.mark.parametrize(
+    "method, instance, value, expected_open",
+    [
+        ("turn_on", "spigot-1", "on", EXPECTED_OPEN_AFTER_ON),
+        ("turn_off", "spigot-2", "off", EXPECTED_OPEN_AFTER_OFF),
+    ],
+)
+async def test_turn_on_off(mocked_controller, method, instance, value, expected_open):
     await mocked_controller.initialize_elem(valve)
     dev = mocked_controller.items[0]
-    await mocked_controller.turn_on(valve.id, instance="spigot-1")
+    await getattr(mocked_controller, method)(valve.id, instance=instance)
     req = utils.get_json_call(mocked_controller)
     assert req["metadeviceId"] == valve.id
     expected_states = [
         {
             "functionClass": "toggle",
-            "functionInstance": "spigot-1",
+            "functionInstance": instance,
             "lastUpdateTime": 12345,
-            "value": "on",
+            "value": value,
         }
     ]
     utils.ensure_states_sent(mocked_controller, expected_states)
-    assert dev.open == {
-        None: features.OpenFeature(open=False, func_class="power", func_instance=None),
-        "spigot-1": features.OpenFeature(
-            open=True, func_class="toggle", func_instance="spigot-1"
-        ),
-        "spigot-2": features.OpenFeature(
-            open=True, func_class="toggle", func_instance="spigot-2"
-        ),
-    }
+    assert dev.open == expected_open
 
 
-@pytest.mark.asyncio
-async def test_turn_off(mocked_controller):
-    await mocked_controller.initialize_elem(valve)
-    dev = mocked_controller.items[0]
-    await mocked_controller.turn_off(valve.id, instance="spigot-2")
-    req = utils.get_json_call(mocked_controller)
-    assert req["metadeviceId"] == valve.id
-    expected_states = [
-        {
-            "functionClass": "toggle",
-            "functionInstance": "spigot-2",
-            "lastUpdateTime": 12345,
-            "value": "off",
-        }
-    ]
-    utils.ensure_states_sent(mocked_controller, expected_states)
-    assert dev.open == {
-        None: features.OpenFeature(open=False, func_class="power", func_instance=None),
-        "spigot-1": features.OpenFeature(
-            open=False, func_class="toggle", func_instance="spigot-1"
-        ),
-        "spigot-2": features.OpenFeature(
-            open=False, func_class="toggle", func_instance="spigot-2"
-        ),
-    }
-
-
-@pytest.mark.asyncio
 async def test_empty_update(mocked_controller):
-    valve = utils.create_devices_from_data("water-timer.json")[0]
     await mocked_controller.initialize_elem(valve)
     assert len(mocked_controller.items) == 1
     updates = await mocked_controller.update_elem(valve)
     assert updates == set()
 
 
-@pytest.mark.asyncio
-async def test_update_elem(mocked_controller):
+async def test_update_elem(mocked_controller, valve_device):
     await mocked_controller.initialize_elem(valve)
     assert len(mocked_controller.items) == 1
     dev = mocked_controller.items[0]
     assert dev.available is True
-    dev_update = utils.create_devices_from_data("water-timer.json")[0]
-    new_states = [
-        HubspaceState(
-            **{
-                "functionClass": "toggle",
-                "value": "on",
-                "lastUpdateTime": 0,
-                "functionInstance": "spigot-1",
-            }
-        ),
-        HubspaceState(
-            **{
-                "functionClass": "toggle",
-                "value": "off",
-                "lastUpdateTime": 0,
-                "functionInstance": "spigot-2",
-            }
-        ),
-        HubspaceState(
-            **{
-                "functionClass": "available",
-                "value": False,
-                "lastUpdateTime": 0,
-                "functionInstance": None,
-            }
-        ),
-    ]
-    for state in new_states:
-        utils.modify_state(dev_update, state)
+    dev_update = valve_device
+    utils.modify_states(dev_update, UPDATE_STATES)
     updates = await mocked_controller.update_elem(dev_update)
     dev = mocked_controller.items[0]
     assert dev.open["spigot-1"].open is True
@@ -143,24 +140,25 @@ async def test_update_elem(mocked_controller):
     assert updates == {"open", "available"}
 
 
-@pytest.mark.asyncio
 async def test_set_state_empty(mocked_controller):
     await mocked_controller.initialize_elem(valve)
     await mocked_controller.set_state(valve.id)
 
 
-@pytest.mark.asyncio
-async def test_valve_emitting(bridge):
-    dev_update = utils.create_devices_from_data("water-timer.json")[0]
+async def test_valve_emitting(bridge, valve_device):
+    dev_update = valve_device
     add_event = {
         "type": "add",
         "device_id": dev_update.id,
         "device": dev_update,
     }
+    # Signal once the controller has finished processing the event
+    processed = asyncio.Event()
+    bridge.valves.subscribe(lambda *args: processed.set())
     # Simulate a poll
     bridge.events.emit(event.EventType.RESOURCE_ADDED, add_event)
-    # Bad way to check, but just wait a second so it can get processed
-    await asyncio.sleep(1)
+    await asyncio.wait_for(processed.wait(), timeout=2.0)
+    processed.clear()
     assert len(bridge.valves._items) == 1
     # Simulate an update
     utils.modify_state(
@@ -177,13 +175,11 @@ async def test_valve_emitting(bridge):
         "device": dev_update,
     }
     bridge.events.emit(event.EventType.RESOURCE_UPDATED, update_event)
-    # Bad way to check, but just wait a second so it can get processed
-    await asyncio.sleep(1)
+    await asyncio.wait_for(processed.wait(), timeout=2.0)
     assert len(bridge.valves._items) == 1
     assert not bridge.valves._items[dev_update.id].available
 
 
-@pytest.mark.asyncio
 async def test_set_state_no_dev(mocked_controller, caplog):
     caplog.set_level(0)
     await mocked_controller.initialize_elem(valve)
@@ -193,7 +189,6 @@ async def test_set_state_no_dev(mocked_controller, caplog):
     assert "Unable to find device" in caplog.text
 
 
-@pytest.mark.asyncio
 async def test_set_state_invalid_instance(mocked_controller, caplog):
     caplog.set_level(0)
     await mocked_controller.initialize_elem(valve)
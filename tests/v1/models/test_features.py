@@ -1,29 +1,50 @@
-from aiohubspace.v1.models import features
-
-
-def test_ColorModeFeature():
-    feat = features.ColorModeFeature("white")
-    assert feat.hs_value == "white"
-
-
-def test_ColorFeature():
-    feat = features.ColorFeature(red=10, green=20, blue=30)
-    assert feat.hs_value == {
-        "value": {
-            "color-rgb": {
-                "r": 10,
-                "g": 20,
-                "b": 30,
-            }
-        }
-    }
+import pytest
 
+from aiohubspace.v1.models import features
 
-def test_ColorTemperatureFeature():
-    feat = features.ColorTemperatureFeature(
-        temperature=3000, supported=[1000, 2000, 3000], prefix="K"
-    )
-    assert feat.hs_value == "3000K"
+HS_VALUE_CASES = [
+    (features.ColorModeFeature, {"mode": "white"}, "white"),
+    (
+        features.ColorFeature,
+        {"red": 10, "green": 20, "blue": 30},
+        {"value": {"color-rgb": {"r": 10, "g": 20, "b": 30}}},
+    ),
+    (
+        features.ColorTemperatureFeature,
+        {"temperature": 3000, "supported": [1000, 2000, 3000], "prefix": "K"},
+        "3000K",
+    ),
+    (
+        features.CurrentPositionFeature,
+        {"position": features.CurrentPositionEnum.LOCKED},
+        "locked",
+    ),
+    (
+        features.DimmingFeature,
+        {"brightness": 30, "supported": [10, 20, 30, 40, 50, 60, 70, 80, 90, 100]},
+        30,
+    ),
+    (features.DirectionFeature, {"forward": True}, "forward"),
+    (features.DirectionFeature, {"forward": False}, "reverse"),
+    (features.ModeFeature, {"mode": "color", "modes": {"color", "white"}}, "color"),
+    (features.OnFeature, {"on": True}, {"value": "on", "functionClass": "power"}),
+    (
+        features.OnFeature,
+        {"on": False, "func_class": "cool", "func_instance": "beans"},
+        {"value": "off", "functionClass": "cool", "functionInstance": "beans"},
+    ),
+    (features.OpenFeature, {"open": True}, {"value": "on", "functionClass": "toggle"}),
+    (
+        features.OpenFeature,
+        {"open": False, "func_class": "cool", "func_instance": "beans"},
+        {"value": "off", "functionClass": "cool", "functionInstance": "beans"},
+    ),
+]
+
+
+@pytest.mark.parametrize("cls,kwargs,expected", HS_VALUE_CASES)
+def test_feature_hs_value(cls, kwargs, expected):
+    assert cls(**kwargs).hs_value == expected
 
 
 def test_CurrentPositionEnum():
@@ -33,25 +54,6 @@ def test_CurrentPositionEnum():
     assert feat.value == features.CurrentPositionEnum.UNKNOWN.value
 
 
-def test_CurrentPositionFeature():
-    feat = features.CurrentPositionFeature(features.CurrentPositionEnum.LOCKED)
-    assert feat.hs_value == "locked"
-
-
-def test_DimmingFeature():
-    feat = features.DimmingFeature(
-        brightness=30, supported=[10, 20, 30, 40, 50, 60, 70, 80, 90, 100]
-    )
-    assert feat.hs_value == 30
-
-
-def test_DirectionFeature():
-    feat = features.DirectionFeature(forward=True)
-    assert feat.hs_value == "forward"
-    feat = features.DirectionFeature(forward=False)
-    assert feat.hs_value == "reverse"
-
-
 def test_EffectFeature():
     feat = features.EffectFeature(
         effect="fade-3", effects={"preset": {"fade-3"}, "custom": {"rainbow"}}
@@ -82,33 +84,6 @@ def test_EffectFeature():
     assert not feat.is_preset("rainbow")
 
 
-def test_ModeFeature():
-    feat = features.ModeFeature(mode="color", modes={"color", "white"})
-    assert feat.hs_value == "color"
-
-
-def test_OnFeature():
-    feat = features.OnFeature(on=True)
-    assert feat.hs_value == {"value": "on", "functionClass": "power"}
-    feat = features.OnFeature(on=False, func_class="cool", func_instance="beans")
-    assert feat.hs_value == {
-        "value": "off",
-        "functionClass": "cool",
-        "functionInstance": "beans",
-    }
-
-
-def test_OpenFeature():
-    feat = features.OpenFeature(open=True)
-    assert feat.hs_value == {"value": "on", "functionClass": "toggle"}
-    feat = features.OpenFeature(open=False, func_class="cool", func_instance="beans")
-    assert feat.hs_value == {
-        "value": "off",
-        "functionClass": "cool",
-        "functionInstance": "beans",
-    }
-
-
 def test_PresetFeature():
     feat = features.PresetFeature(
         enabled=True, func_class="cool", func_instance="beans"
@@ -138,5 +113,12 @@ def test_SpeedFeature():
         ],
     )
     assert feat.hs_value == "speed-4-25"
+    assert feat.percentages == {
+        "speed-4-0": 20,
+        "speed-4-25": 40,
+        "speed-4-50": 60,
+        "speed-4-75": 80,
+        "speed-4-100": 100,
+    }
     feat.speed = 50
     assert feat.hs_value == "speed-4-50"
@@ -2,6 +2,7 @@ import pytest
 
 from aiohubspace.v1.models import features
 from aiohubspace.v1.models.lock import Lock
+from aiohubspace.v1.models.resource import ResourceTypes
 
 
 @pytest.fixture
@@ -26,6 +27,7 @@ def populated_entity():
 
 def test_init(populated_entity):
     assert populated_entity.id == "entity-1"
+    assert populated_entity.type == ResourceTypes.LOCK
 
 
 def test_get_instance(populated_entity):
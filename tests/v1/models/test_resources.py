@@ -1,5 +1,50 @@
+import pytest
+
 from aiohubspace.v1.models import resource
 
+from .. import utils
+
 
 def test_resource_type_unknown():
     assert resource.ResourceTypes("beans") == resource.ResourceTypes.UNKNOWN
+
+
+@pytest.mark.parametrize(
+    "functions,expected",
+    [
+        ([], {}),
+        (
+            [
+                {"functionClass": "power", "functionInstance": "light-power"},
+                {"functionClass": "toggle"},
+                {"functionClass": "preset", "functionInstance": "preset-1"},
+            ],
+            {"power": "light-power", "toggle": None, "preset": "preset-1"},
+        ),
+        # Last function wins
+        (
+            [
+                {"functionClass": "power", "functionInstance": "light-power"},
+                {"functionClass": "power", "functionInstance": None},
+            ],
+            {"power": None},
+        ),
+    ],
+)
+def test_build_instances(functions, expected):
+    assert resource.build_instances(functions) == expected
+
+
+def test_DeviceInformation_from_hs_device():
+    dev = utils.create_devices_from_data("door-lock-TBD.json")[0]
+    info = resource.DeviceInformation.from_hs_device(dev, wifi_mac="wifi")
+    assert info == resource.DeviceInformation(
+        device_class=dev.device_class,
+        default_image=dev.default_image,
+        default_name=dev.default_name,
+        manufacturer=dev.manufacturerName,
+        model=dev.model,
+        name=dev.friendly_name,
+        parent_id=dev.device_id,
+        wifi_mac="wifi",
+    )
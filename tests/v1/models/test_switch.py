@@ -1,6 +1,7 @@
 import pytest
 
 from aiohubspace.v1.models import features
+from aiohubspace.v1.models.resource import ResourceTypes
 from aiohubspace.v1.models.switch import Switch
 
 
@@ -42,6 +43,7 @@ def empty_entity():
 
 def test_init(populated_entity):
     assert populated_entity.id == "entity-1"
+    assert populated_entity.type == ResourceTypes.SWITCH
     assert populated_entity.available is True
     assert populated_entity.instances == {"preset": "preset-1"}
     assert populated_entity.on[None].on is True
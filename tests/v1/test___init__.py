@@ -1,7 +1,13 @@
+import dataclasses
+import logging
+import os
+
+import orjson
 import pytest
 
 from aiohubspace import EventType, InvalidAuth
 from aiohubspace.errors import DeviceNotFound
+from aiohubspace.v1 import HubspaceBridgeV1, get_headers, v1_const
 from aiohubspace.v1.controllers.device import DeviceController
 from aiohubspace.v1.controllers.event import EventStream
 from aiohubspace.v1.controllers.fan import FanController
@@ -13,6 +19,7 @@ from aiohubspace.v1.controllers.valve import ValveController
 from . import utils
 
 zandra_light = utils.create_devices_from_data("fan-ZandraFan.json")[1]
+DEVICE_DUMPS = sorted(os.listdir(os.path.join(utils.current_path, "device_dumps")))
 
 
 @pytest.mark.skip(reason="Not yet implemented")
@@ -20,6 +27,29 @@ def test_context_manager(mocked_bridge):
     pass
 
 
+@pytest.fixture
+def bridge_logger():
+    """Logger used by the logger-user bridges, with its handlers removed after"""
+    logger = logging.getLogger("aiohubspace.v1[logger-user]")
+    yield logger
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+
+
+def test_logger_handler_added_once(bridge_logger):
+    HubspaceBridgeV1("logger-user", "password")
+    HubspaceBridgeV1("logger-user", "password")
+    assert len(bridge_logger.handlers) == 1
+    assert isinstance(bridge_logger.handlers[0], logging.StreamHandler)
+
+
+def test_logger_existing_handler(bridge_logger):
+    handler = logging.NullHandler()
+    bridge_logger.addHandler(handler)
+    HubspaceBridgeV1("logger-user", "password")
+    assert bridge_logger.handlers == [handler]
+
+
 def test_devices(mocked_bridge):
     assert isinstance(mocked_bridge.devices, DeviceController)
 
@@ -64,12 +94,58 @@ def test_controllers(mocked_bridge):
     ]
 
 
+def test_function_classes(mocked_bridge):
+    function_classes = mocked_bridge.function_classes
+    for controller in mocked_bridge._controllers:
+        assert controller.ITEM_STATES <= function_classes
+    assert "wifi-ssid" not in function_classes
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("file_name", DEVICE_DUMPS)
+async def test_item_states_cover_reads(file_name, mocked_bridge):
+    """Controllers only read states that survive the poll filter"""
+    for hs_device in utils.create_devices_from_data(file_name):
+        for controller in mocked_bridge._controllers:
+            if controller.ITEM_TYPES and hs_device.device_class not in {
+                x.value for x in controller.ITEM_TYPES
+            }:
+                continue
+            filtered = dataclasses.replace(
+                hs_device,
+                states=[
+                    state
+                    for state in hs_device.states
+                    if state.functionClass in controller.ITEM_STATES
+                ],
+            )
+            name = type(controller).__name__
+            expected = await controller.initialize_elem(hs_device)
+            assert await controller.initialize_elem(filtered) == expected, name
+            # Updating from every state must match updating from the filtered ones
+            results = []
+            for update in [hs_device, filtered]:
+                item = await controller.initialize_elem(filtered)
+                controller._items[hs_device.id] = item
+                controller._last_states.pop(hs_device.id, None)
+                results.append((await controller.update_elem(update), item))
+            assert results[0] == results[1], name
+
+
 def test_tracked_devices(mocked_bridge):
     assert mocked_bridge.tracked_devices == set()
     mocked_bridge.add_device(zandra_light.id, mocked_bridge.lights)
     assert mocked_bridge.tracked_devices == {zandra_light.id}
 
 
+def test_tracked_ids(mocked_bridge):
+    tracked_ids = mocked_bridge.tracked_ids
+    assert set(tracked_ids) == set()
+    mocked_bridge.add_device(zandra_light.id, mocked_bridge.lights)
+    assert zandra_light.id in tracked_ids
+    assert tracked_ids - {"beans"} == {zandra_light.id}
+
+
 def test_add_device(mocked_bridge):
     assert mocked_bridge.tracked_devices == set()
     mocked_bridge.add_device(zandra_light.id, mocked_bridge.lights)
@@ -134,6 +210,7 @@ async def test_fetch_data(expected_val, error, mocked_bridge_req, mocker):
     mocker.patch.object(mocked_bridge_req, "request", return_value=expected)
     if not error:
         assert await mocked_bridge_req.fetch_data() == expected_val
+        assert expected.json.call_args.kwargs == {"loads": orjson.loads}
     else:
         with pytest.raises(ValueError):
             await mocked_bridge_req.fetch_data()
@@ -167,3 +244,12 @@ async def test_create_request_err(mocked_bridge, mocker):
             pass
 
     emit.assert_called_once_with(EventType.INVALID_AUTH)
+
+
+def test_get_headers():
+    assert get_headers(authorization="Bearer token", host="cool.beans") == {
+        **v1_const.DEFAULT_HEADERS,
+        "authorization": "Bearer token",
+        "host": "cool.beans",
+    }
+    assert get_headers() is not v1_const.DEFAULT_HEADERS
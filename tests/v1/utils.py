@@ -1,5 +1,8 @@
+import copy
+import dataclasses
 import json
 import os
+from functools import lru_cache
 from typing import Any
 
 from aiohubspace.device import HubspaceDevice, HubspaceState
@@ -7,8 +10,9 @@ from aiohubspace.device import HubspaceDevice, HubspaceState
 current_path: str = os.path.dirname(os.path.realpath(__file__))
 
 
-def get_device_dump(file_name: str) -> Any:
-    """Get a device dump
+@lru_cache(maxsize=None)
+def _load_device_dump(file_name: str) -> Any:
+    """Parse a device dump once per test session
 
     :param file_name: Name of the file to load
     """
@@ -16,6 +20,16 @@ def get_device_dump(file_name: str) -> Any:
         return json.load(fh)
 
 
+def get_device_dump(file_name: str) -> Any:
+    """Get a device dump
+
+    Returns a copy so tests can freely modify the result
+
+    :param file_name: Name of the file to load
+    """
+    return copy.deepcopy(_load_device_dump(file_name))
+
+
 def get_raw_dump(file_name: str) -> Any:
     """Get a device dump
 
@@ -47,6 +61,30 @@ def create_device_from_data(device: dict) -> HubspaceDevice:
     return HubspaceDevice(**device)
 
 
+def to_raw_device(device: HubspaceDevice) -> dict:
+    """Convert a HubspaceDevice back into the format returned by Hubspace
+
+    :param device: Device to convert
+    """
+    return {
+        "id": device.id,
+        "deviceId": device.device_id,
+        "friendlyName": device.friendly_name,
+        "children": device.children,
+        "description": {
+            "defaultImage": device.default_image,
+            "functions": device.functions,
+            "device": {
+                "model": device.model,
+                "deviceClass": device.device_class,
+                "defaultName": device.default_name,
+                "manufacturerName": device.manufacturerName,
+            },
+        },
+        "state": {"values": [dataclasses.asdict(state) for state in device.states]},
+    }
+
+
 def get_json_call(mocked_controller):
     mocked_controller._bridge.request.assert_called_once()
     call = mocked_controller._bridge.request.call_args_list[0][1]
@@ -78,3 +116,13 @@ def modify_state(device: HubspaceDevice, new_state):
             continue
         device.states[ind] = new_state
         break
+
+
+def modify_states(device: HubspaceDevice, new_states):
+    """Apply modify_state for each of the new states, in order
+
+    :param device: Device to update
+    :param new_states: States to place onto the device
+    """
+    for state in new_states:
+        modify_state(device, state)